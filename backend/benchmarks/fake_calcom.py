@@ -0,0 +1,260 @@
+# Deterministic local stand-in for the Cal.com v2 API, used for benchmarking
+# Covers the endpoints CalComTool uses: me, event-types, slots, bookings, cancel
+#
+# Usage:
+#   python benchmarks/fake_calcom.py --port 3030 --latency-ms 80 --error-rate 0.02
+#   CALCOM_API_BASE_URL=http://localhost:3030/v2/ CALCOM_API_KEY=fake python main.py
+#
+# With --webhook-url and --webhook-secret, booking changes are also delivered
+# as signed Cal.com webhooks (see benchmarks/webhook_simulator.py)
+
+import argparse
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask, jsonify, request
+
+from webhook_simulator import build_event, send_event
+
+app = Flask(__name__)
+
+config = {
+    "latency_ms": 0.0,  # base latency added to every request
+    "jitter_ms": 0.0,  # uniform random latency added on top
+    "slow_rate": 0.0,  # fraction of requests that are slow (tail latency)
+    "slow_ms": 1000.0,
+    "error_rate": 0.0,  # fraction of requests answered with a 503
+    "slot_minutes": 30,
+    "webhook_url": None,  # deliver BOOKING_* webhooks here when set
+    "webhook_secret": None,
+}
+
+USER = {"id": 1650861, "username": "tommyjtl", "email": "host@example.com"}
+
+_lock = threading.Lock()
+_rng = random.Random(0)
+event_types = []
+bookings = {}  # uid -> booking
+
+
+def seed_data(num_event_types, num_bookings, attendee_email, seed):
+    global _rng
+    _rng = random.Random(seed)
+
+    event_types.clear()
+    base_titles = ["15 min meeting", "30 min meeting", "60 min meeting"]
+    for i in range(num_event_types):
+        title = base_titles[i] if i < len(base_titles) else f"Event type {i}"
+        length = [15, 30, 60][i % 3]
+        event_types.append(
+            {
+                "id": 2935830 + i,
+                "title": title,
+                "slug": title.lower().replace(" ", "-"),
+                "lengthInMinutes": length,
+                "ownerId": USER["id"],
+            }
+        )
+
+    bookings.clear()
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    for i in range(num_bookings):
+        event_type = event_types[i % len(event_types)]
+        booking_start = start + timedelta(hours=i + 1)
+        _add_booking(event_type, booking_start, attendee_email, "Load Test")
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _add_booking(event_type, start, email, name):
+    uid = uuid.UUID(int=_rng.getrandbits(128)).hex[:22]
+    booking = {
+        "id": len(bookings) + 1,
+        "uid": uid,
+        "title": event_type["title"],
+        "status": "accepted",
+        "start": _iso(start),
+        "end": _iso(start + timedelta(minutes=event_type["lengthInMinutes"])),
+        "eventTypeId": event_type["id"],
+        "attendees": [{"name": name, "email": email, "timeZone": "UTC"}],
+    }
+    bookings[uid] = booking
+    return booking
+
+
+def _notify(trigger, booking):
+    if not config["webhook_url"]:
+        return
+
+    def deliver():
+        # Cal.com delivers webhooks asynchronously, after answering the API call
+        try:
+            status, body = send_event(
+                config["webhook_url"],
+                config["webhook_secret"],
+                build_event(trigger, booking),
+            )
+            print(f"Webhook {trigger} {booking['uid']} -> HTTP {status}: {body}")
+        except Exception as e:
+            print(f"Webhook {trigger} {booking['uid']} failed: {e}")
+
+    threading.Thread(target=deliver, daemon=True).start()
+
+
+@app.before_request
+def simulate_upstream():
+    if not request.headers.get("Authorization"):
+        return jsonify({"status": "error", "error": "Unauthorized"}), 401
+
+    delay = config["latency_ms"] + random.uniform(0, config["jitter_ms"])
+    if random.random() < config["slow_rate"]:
+        delay += config["slow_ms"]
+    if delay:
+        time.sleep(delay / 1000)
+
+    if random.random() < config["error_rate"]:
+        return jsonify({"status": "error", "error": "Service Unavailable"}), 503
+
+
+@app.route("/v2/me", methods=["GET"])
+def me():
+    return jsonify({"status": "success", "data": USER})
+
+
+@app.route("/v2/event-types", methods=["GET"])
+def list_event_types():
+    return jsonify({"status": "success", "data": event_types})
+
+
+@app.route("/v2/event-types", methods=["POST"])
+def create_event_type():
+    body = request.get_json() or {}
+    with _lock:
+        event_type = {
+            "id": 2935830 + len(event_types),
+            "title": body.get("title", "Untitled"),
+            "slug": body.get("slug", "untitled"),
+            "lengthInMinutes": body.get("lengthInMinutes", 30),
+            "ownerId": USER["id"],
+        }
+        event_types.append(event_type)
+    return jsonify({"status": "success", "data": event_type}), 201
+
+
+@app.route("/v2/event-types/<int:event_type_id>", methods=["GET"])
+def get_event_type(event_type_id):
+    for event_type in event_types:
+        if event_type["id"] == event_type_id:
+            return jsonify({"status": "success", "data": event_type})
+    return jsonify({"status": "error", "error": "Not Found"}), 404
+
+
+@app.route("/v2/slots", methods=["GET"])
+def slots():
+    start = datetime.strptime(request.args["start"][:10], "%Y-%m-%d")
+    end = datetime.strptime(request.args["end"][:10], "%Y-%m-%d")
+    with _lock:
+        taken = {b["start"] for b in bookings.values() if b["status"] == "accepted"}
+
+    data = {}
+    day = start
+    while day <= end:
+        day_slots = []
+        slot = day
+        while slot < day + timedelta(days=1):
+            slot_iso = _iso(slot)
+            if slot_iso not in taken:
+                day_slots.append({"start": slot_iso})
+            slot += timedelta(minutes=config["slot_minutes"])
+        data[day.strftime("%Y-%m-%d")] = day_slots
+        day += timedelta(days=1)
+    return jsonify({"status": "success", "data": data})
+
+
+@app.route("/v2/bookings", methods=["GET"])
+def list_bookings():
+    email = request.args.get("attendeeEmail")
+    take = int(request.args.get("take", 20))
+    skip = int(request.args.get("skip", 0))
+    with _lock:
+        matches = [
+            b
+            for b in bookings.values()
+            if b["status"] == "accepted"
+            and any(a["email"] == email for a in b["attendees"])
+        ]
+    matches.sort(key=lambda b: b["start"])
+    return jsonify({"status": "success", "data": matches[skip : skip + take]})
+
+
+@app.route("/v2/bookings", methods=["POST"])
+def create_booking():
+    body = request.get_json() or {}
+    event_type = next(
+        (e for e in event_types if e["id"] == body.get("eventTypeId")), None
+    )
+    if event_type is None:
+        return jsonify({"status": "error", "error": "Event type not found"}), 400
+
+    start = datetime.strptime(body["start"][:19], "%Y-%m-%dT%H:%M:%S")
+    attendee = body.get("attendee", {})
+    with _lock:
+        booking = _add_booking(
+            event_type, start, attendee.get("email"), attendee.get("name")
+        )
+    _notify("BOOKING_CREATED", dict(booking))
+    return jsonify({"status": "success", "data": booking}), 201
+
+
+@app.route("/v2/bookings/<uid>/cancel", methods=["POST"])
+def cancel_booking(uid):
+    with _lock:
+        booking = bookings.get(uid)
+        if booking is None:
+            return jsonify({"status": "error", "error": "Booking not found"}), 404
+        booking["status"] = "cancelled"
+    _notify("BOOKING_CANCELLED", dict(booking))
+    return jsonify({"status": "success", "data": booking})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Cal.com v2 API server")
+    parser.add_argument("--port", type=int, default=3030)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-ms", type=float, default=1000.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--event-types", type=int, default=10)
+    parser.add_argument("--bookings", type=int, default=20)
+    parser.add_argument("--attendee-email", default="loadtest@example.com")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--webhook-url", help="e.g. http://localhost:3020/api/webhooks/calcom"
+    )
+    parser.add_argument("--webhook-secret", default="dev-secret")
+    args = parser.parse_args()
+
+    config.update(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        error_rate=args.error_rate,
+        webhook_url=args.webhook_url,
+        webhook_secret=args.webhook_secret,
+    )
+    random.seed(args.seed)
+    seed_data(args.event_types, args.bookings, args.attendee_email, args.seed)
+
+    print(f"Fake Cal.com API listening on http://localhost:{args.port}/v2/")
+    app.run(host="0.0.0.0", port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
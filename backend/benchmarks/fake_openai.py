@@ -0,0 +1,165 @@
+# Local stand-in for the OpenAI chat completions API, used for benchmarking
+# Answers with scripted tool calls so /api/chat exercises the Cal.com tools
+#
+# Usage:
+#   python benchmarks/fake_openai.py --port 3031 --latency-ms 600
+#   OPENAI_BASE_URL=http://localhost:3031/v1 OPENAI_API_KEY_LIVEXAI=fake python main.py
+#
+# By default the reply is derived from the last user message:
+#   "... list ..."   -> list_all_cal_bookings
+#   "... cancel ..." -> cancel_user_booking
+#   "... book ..."   -> create_a_cal_booking
+#   anything else    -> a plain assistant message
+# With --script, replies are taken in turn from a JSON list of
+# {"tool": "<name>", "arguments": {...}} or {"content": "<text>"} items.
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+
+from flask import Flask, jsonify, request
+
+app = Flask(__name__)
+
+config = {"latency_ms": 0.0, "jitter_ms": 0.0, "script": None}
+_script_lock = threading.Lock()
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+DATETIME_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:\d{2})?"
+)
+EVENT_NAME_PATTERN = re.compile(r"\d+ min meeting")
+
+
+def scripted_reply(user_message):
+    """
+    Return ("tool", name, arguments) or ("content", text) for a user message
+    """
+    if config["script"] is not None:
+        with _script_lock:
+            item = next(config["script"])
+        if "tool" in item:
+            return "tool", item["tool"], item.get("arguments", {})
+        return "content", item.get("content", "")
+
+    message = user_message.lower()
+    email_match = EMAIL_PATTERN.search(user_message)
+    email = email_match.group(0) if email_match else "loadtest@example.com"
+    datetime_match = DATETIME_PATTERN.search(user_message)
+    datetime_start = (
+        datetime_match.group(0) if datetime_match else "2030-01-07T10:00:00.000Z"
+    )
+    event_match = EVENT_NAME_PATTERN.search(message)
+    event_name = event_match.group(0) if event_match else "30 min meeting"
+
+    if "cancel" in message:
+        return (
+            "tool",
+            "cancel_user_booking",
+            {
+                "user_email": email,
+                "booking_name": event_name,
+                "datetime_start": datetime_start,
+            },
+        )
+    if "book" in message and "bookings" not in message:
+        return (
+            "tool",
+            "create_a_cal_booking",
+            {
+                "event_name": event_name,
+                "datetime_start": datetime_start,
+                "timezone": "UTC",
+                "reason": "Load test booking",
+                "user_email": email,
+                "user_name": "Load Test",
+            },
+        )
+    if "list" in message or "bookings" in message:
+        return "tool", "list_all_cal_bookings", {"user_email": email}
+    return "content", "I can help you book, list or cancel meetings."
+
+
+@app.route("/v1/chat/completions", methods=["POST"])
+def chat_completions():
+    body = request.get_json() or {}
+    messages = body.get("messages", [])
+    user_message = next(
+        (m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"),
+        "",
+    )
+
+    delay = config["latency_ms"] + random.uniform(0, config["jitter_ms"])
+    if delay:
+        time.sleep(delay / 1000)
+
+    reply = scripted_reply(user_message)
+    if reply[0] == "tool":
+        _, name, arguments = reply
+        message = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": f"call_{uuid.uuid4().hex[:24]}",
+                    "type": "function",
+                    "function": {"name": name, "arguments": json.dumps(arguments)},
+                }
+            ],
+        }
+        finish_reason = "tool_calls"
+    else:
+        message = {"role": "assistant", "content": reply[1]}
+        finish_reason = "stop"
+
+    prompt_tokens = sum(len(str(m.get("content") or "")) // 4 for m in messages)
+    completion_tokens = 20
+    return jsonify(
+        {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-4.1"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "logprobs": None,
+                    "finish_reason": finish_reason,
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI chat completions server")
+    parser.add_argument("--port", type=int, default=3031)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--script", help="JSON file with a list of scripted replies")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    config.update(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as f:
+            config["script"] = itertools.cycle(json.load(f))
+
+    print(f"Fake OpenAI API listening on http://localhost:{args.port}/v1")
+    app.run(host="0.0.0.0", port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Import-time budget for the backend entry point
+#
+# Usage:
+#   python benchmarks/import_time.py                  # median of 5 cold imports
+#   python benchmarks/import_time.py --budget-ms 500  # fail when over budget
+#   python benchmarks/import_time.py --top 15         # slowest modules
+#
+# Each run imports `main` in a fresh interpreter with `-X importtime`. Clients
+# and rarely used modules are deferred to first use or to `main.warm_up()`,
+# so no API key or network access is needed.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+
+def measure(module):
+    """
+    Import `module` in a fresh interpreter and return {module: cumulative_us}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of main.py")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("IMPORT_BUDGET_MS", "500")),
+        help="Fail when the median import time exceeds this",
+    )
+    parser.add_argument("--json", help="Write machine-readable results to this file")
+    args = parser.parse_args()
+
+    measure(args.module)  # warm the filesystem and bytecode caches
+    runs = [measure(args.module) for _ in range(args.runs)]
+    totals_ms = [run[args.module] / 1000 for run in runs]
+    median_ms = statistics.median(totals_ms)
+
+    # Top-level packages only, i.e. what importing them costs on their own
+    last = runs[-1]
+    slowest = sorted(
+        ((name, us) for name, us in last.items() if "." not in name),
+        key=lambda item: item[1],
+        reverse=True,
+    )[: args.top + 1]
+
+    print(f"import {args.module}: median {median_ms:.1f} ms over {args.runs} runs")
+    print(f"{'module':<30} {'cumulative ms':>14}")
+    for name, us in slowest:
+        print(f"{name:<30} {us / 1000:>14.1f}")
+
+    within_budget = median_ms <= args.budget_ms
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "module": args.module,
+                    "median_ms": round(median_ms, 1),
+                    "runs_ms": [round(ms, 1) for ms in totals_ms],
+                    "budget_ms": args.budget_ms,
+                    "slowest": {name: round(us / 1000, 1) for name, us in slowest},
+                },
+                f,
+                indent=2,
+            )
+    if not within_budget:
+        print(f"Over budget: {median_ms:.1f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Load generator for /api/chat
+# Drives the backend at fixed concurrency levels and reports throughput and
+# latency percentiles. Meant to run against the local stand-ins:
+#
+#   python benchmarks/fake_calcom.py --latency-ms 80 &
+#   python benchmarks/fake_openai.py --latency-ms 600 &
+#   CALCOM_API_BASE_URL=http://localhost:3030/v2/ CALCOM_API_KEY=fake CALCOM_RATE_LIMIT_PER_MINUTE=0 \
+#   OPENAI_BASE_URL=http://localhost:3031/v1 OPENAI_API_KEY_LIVEXAI=fake \
+#   python main.py &
+#   python benchmarks/load_test.py --concurrency 1,4,16 --requests 200
+
+import argparse
+import json
+import math
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+DEFAULT_MESSAGES = [
+    "List my bookings for loadtest@example.com",
+    "Book a 30 min meeting at 2030-01-07T10:00:00.000Z for loadtest@example.com",
+    "Cancel my 30 min meeting at 2030-01-07T10:00:00.000Z for loadtest@example.com",
+    "Hello, what can you do?",
+]
+
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def send_chat(session, base_url, message, timeout):
+    session_id = f"loadtest-{uuid.uuid4().hex}"
+    started_at = time.perf_counter()
+    try:
+        response = session.post(
+            f"{base_url}/api/chat",
+            json={"message": message, "session_id": session_id},
+            timeout=timeout,
+        )
+        ok = response.status_code == 200
+        status = response.status_code
+    except requests.exceptions.RequestException as e:
+        ok = False
+        status = type(e).__name__
+    latency = time.perf_counter() - started_at
+
+    # Keep the server's session store from growing during the run
+    try:
+        session.delete(f"{base_url}/api/sessions/{session_id}", timeout=timeout)
+    except requests.exceptions.RequestException:
+        pass
+    return ok, status, latency
+
+
+def run_level(base_url, concurrency, total_requests, messages, timeout):
+    sessions = [requests.Session() for _ in range(concurrency)]
+
+    def worker(i):
+        return send_chat(
+            sessions[i % concurrency], base_url, messages[i % len(messages)], timeout
+        )
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(worker, range(total_requests)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies = sorted(latency for ok, _, latency in results if ok)
+    errors = {}
+    for ok, status, _ in results:
+        if not ok:
+            errors[str(status)] = errors.get(str(status), 0) + 1
+
+    def ms(value):
+        return round(value * 1000, 1) if value is not None else None
+
+    return {
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "succeeded": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "p50_ms": ms(percentile(latencies, 50)),
+        "p95_ms": ms(percentile(latencies, 95)),
+        "p99_ms": ms(percentile(latencies, 99)),
+        "max_ms": ms(latencies[-1] if latencies else None),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the /api/chat endpoint")
+    parser.add_argument("--url", default="http://localhost:3020")
+    parser.add_argument(
+        "--concurrency", default="1,4,16", help="Comma-separated concurrency levels"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=100, help="Requests per concurrency level"
+    )
+    parser.add_argument(
+        "--message",
+        action="append",
+        help="Message to send (repeatable), defaults to a list/book/cancel mix",
+    )
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--json-output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    messages = args.message or DEFAULT_MESSAGES
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    results = []
+    print(
+        f"{'conc':>5} {'ok':>6} {'err':>5} {'rps':>8} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for concurrency in levels:
+        result = run_level(args.url, concurrency, args.requests, messages, args.timeout)
+        results.append(result)
+        print(
+            f"{concurrency:>5} {result['succeeded']:>6} "
+            f"{sum(result['errors'].values()):>5} {result['throughput_rps']:>8} "
+            f"{result['p50_ms']!s:>9} {result['p95_ms']!s:>9} {result['p99_ms']!s:>9}"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump({"url": args.url, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
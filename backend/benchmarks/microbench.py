@@ -0,0 +1,287 @@
+# Offline microbenchmarks for the per-request hot paths in cal.py and utils/
+#
+# Usage:
+#   python benchmarks/microbench.py                      # run, print a table
+#   python benchmarks/microbench.py --json out.json      # also write results
+#   python benchmarks/microbench.py --save-baseline      # record new baselines
+#   python benchmarks/microbench.py --compare            # fail on regressions
+#
+# No network access is needed: Cal.com responses are synthesized in memory.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from flask import Flask
+from loguru import logger
+from openai.types.chat.chat_completion import Choice
+
+from cal import (
+    CalComTool,
+    FunctionReturnCode,
+    FunctionReturnStatus,
+    function_return,
+)
+from utils.datetime import convert_to_utc_format, get_day_range_utc
+from utils.print import to_serializable
+from utils.serialization import FastJSONProvider
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines", "microbench.json")
+
+# Benchmarks measure our own code, not the log sink
+logger.remove()
+
+
+def make_event_types(count):
+    return {
+        "status": "success",
+        "data": [
+            {
+                "id": 2935830 + i,
+                "title": f"Event type number {i}",
+                "slug": f"event-type-number-{i}",
+                "lengthInMinutes": 30,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def make_bookings(count):
+    start = datetime(2030, 1, 7, 9, 0, tzinfo=timezone.utc)
+    return {
+        "status": "success",
+        "data": [
+            {
+                "id": i,
+                "uid": f"uid{i:019d}",
+                "title": "30 min meeting",
+                "status": "accepted",
+                "start": (start + timedelta(minutes=30 * i)).strftime(
+                    "%Y-%m-%dT%H:%M:%S.000Z"
+                ),
+                "end": (start + timedelta(minutes=30 * (i + 1))).strftime(
+                    "%Y-%m-%dT%H:%M:%S.000Z"
+                ),
+                "attendees": [{"name": "Load Test", "email": "a@example.com"}],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def make_choice():
+    return Choice.model_validate(
+        {
+            "index": 0,
+            "finish_reason": "tool_calls",
+            "logprobs": None,
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "call_0123456789abcdef01234567",
+                        "type": "function",
+                        "function": {
+                            "name": "create_a_cal_booking",
+                            "arguments": json.dumps(
+                                {
+                                    "event_name": "30 min meeting",
+                                    "datetime_start": "2030-01-07T10:00:00.000-08:00",
+                                    "timezone": "America/Los_Angeles",
+                                    "reason": "Quarterly planning sync",
+                                    "user_email": "a@example.com",
+                                    "user_name": "Load Test",
+                                }
+                            ),
+                        },
+                    }
+                ],
+            },
+        }
+    )
+
+
+def offline_tool(event_types=None, bookings=None):
+    tool = CalComTool(api_key="offline", validate_api_key=False)
+    if event_types is not None:
+        tool.get_all_event_types = lambda: event_types
+    if bookings is not None:
+        tool.get_all_bookings = lambda attendee_email, status="upcoming": bookings
+    return tool
+
+
+def build_benchmarks():
+    """
+    Return a list of (name, callable) pairs
+    """
+    benchmarks = []
+
+    for count in (10, 1_000, 10_000):
+        tool = offline_tool(event_types=make_event_types(count))
+        # Worst case: a name that only matches the last event type
+        target = f"Event type number {count - 1}"
+        benchmarks.append(
+            (
+                f"find_event_id_by_name[{count}]",
+                lambda tool=tool, target=target: tool.find_event_id_by_name(target),
+            )
+        )
+
+    for count in (20, 1_000):
+        tool = offline_tool(bookings=make_bookings(count))
+        # No title matches: every entry's title is compared, but no start time
+        # is parsed (the title_match case below covers parsing)
+        benchmarks.append(
+            (
+                f"find_booking_uid_by_name_and_datetime[{count}]",
+                lambda tool=tool: tool.find_booking_uid_by_name_and_datetime(
+                    "a@example.com", "missing meeting", "2031-01-01T00:00:00.000Z"
+                ),
+            )
+        )
+
+    # Every title matches, so each booking's start time has to be converted
+    tool = offline_tool(bookings=make_bookings(1_000))
+    benchmarks.append(
+        (
+            "find_booking_uid_by_name_and_datetime[1000,title_match]",
+            lambda tool=tool: tool.find_booking_uid_by_name_and_datetime(
+                "a@example.com", "30 min meeting", "2031-01-01T00:00:00.000Z"
+            ),
+        )
+    )
+
+    benchmarks += [
+        (
+            "convert_to_utc_format[zulu]",
+            lambda: convert_to_utc_format("2030-01-07T10:00:00.000Z"),
+        ),
+        (
+            "convert_to_utc_format[offset]",
+            lambda: convert_to_utc_format("2030-01-07T10:00:00.000-08:00"),
+        ),
+        (
+            "convert_to_utc_format[naive+tz]",
+            lambda: convert_to_utc_format("2030-01-07T10:00:00", "America/Los_Angeles"),
+        ),
+        (
+            "get_day_range_utc",
+            lambda: get_day_range_utc("2030-01-07T10:00:00.000Z"),
+        ),
+        (
+            "function_return",
+            lambda: function_return(
+                status=FunctionReturnStatus.SUCCESS,
+                result_code=FunctionReturnCode.FOUND_MATCH,
+                result_message="Found the exact match",
+                result_data={"title": "30 min meeting", "slug": "30min", "id": 1},
+            ),
+        ),
+    ]
+
+    choice = make_choice()
+    benchmarks.append(("to_serializable[choice]", lambda: to_serializable(choice)))
+
+    # Body of a typical /api/chat response: the whole session history
+    provider = FastJSONProvider(Flask(__name__))
+    history = [to_serializable(choice)["message"] for _ in range(20)]
+    benchmarks.append(
+        ("json_dumps[chat_response]", lambda: provider.dumps({"messages": history}))
+    )
+    return benchmarks
+
+
+def run_benchmark(fn, repeat):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()  # enough calls for >= 0.2s per run
+    per_call = [total / number * 1e6 for total in timer.repeat(repeat, number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_us": round(min(per_call), 3),
+        "median_us": round(statistics.median(per_call), 3),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Return the benchmarks whose min time regressed by more than `threshold`
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["min_us"] / baseline[name]["min_us"]
+        result["vs_baseline"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline microbenchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="Only run benchmarks containing this text")
+    parser.add_argument("--json", help="Write machine-readable results to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown vs the baseline before failing (0.25 = 25%%)",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name, fn in build_benchmarks():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = run_benchmark(fn, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold)
+
+    print(f"{'benchmark':<50} {'min us':>12} {'median us':>12} {'vs base':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:<50} {result['min_us']:>12.3f} {result['median_us']:>12.3f} "
+            f"{result.get('vs_baseline', '-')!s:>8}"
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+        "regressions": regressions,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({**report, "regressions": []}, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.compare and regressions:
+        print(f"Regressions beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# Sends signed Cal.com webhook events to the backend, standing in for Cal.com
+# when testing push-based cache invalidation locally (see /api/webhooks/calcom).
+# Payloads follow the shape of Cal.com's BOOKING_* webhook deliveries.
+#
+# Usage:
+#   CALCOM_WEBHOOK_SECRET=dev-secret python main.py &
+#   python benchmarks/webhook_simulator.py --secret dev-secret --trigger cancelled \
+#       --email loadtest@example.com --start 2030-01-07T10:00:00.000Z
+#
+# benchmarks/fake_calcom.py uses `send_event` to deliver events for the bookings
+# it creates and cancels when started with --webhook-url / --webhook-secret.
+
+import argparse
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.webhooks import sign_payload
+
+TRIGGERS = {
+    "created": "BOOKING_CREATED",
+    "cancelled": "BOOKING_CANCELLED",
+    "rescheduled": "BOOKING_RESCHEDULED",
+}
+
+
+def build_event(trigger, booking, previous=None):
+    """
+    Cal.com webhook event for a booking shaped like the v2 API's
+    (uid, title, start, end, eventTypeId, attendees); `previous` is the
+    booking a BOOKING_RESCHEDULED event moved away from
+    """
+    payload = {
+        "type": booking.get("title"),
+        "title": booking.get("title"),
+        "uid": booking["uid"],
+        "bookingId": booking.get("id"),
+        "eventTypeId": booking.get("eventTypeId"),
+        "startTime": booking["start"],
+        "endTime": booking["end"],
+        "attendees": booking.get("attendees", []),
+        "status": "CANCELLED" if trigger == "BOOKING_CANCELLED" else "ACCEPTED",
+    }
+    if previous is not None:
+        payload.update(
+            rescheduleUid=previous["uid"],
+            rescheduleStartTime=previous["start"],
+            rescheduleEndTime=previous["end"],
+        )
+    return {
+        "triggerEvent": trigger,
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "payload": payload,
+    }
+
+
+def send_event(url, secret, event, timeout=5):
+    """
+    Sign and deliver one event; returns (status code, parsed body or text)
+    """
+    body = json.dumps(event).encode("utf-8")
+    response = requests.post(
+        url,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-Cal-Signature-256": sign_payload(secret, body),
+        },
+        timeout=timeout,
+    )
+    try:
+        return response.status_code, response.json()
+    except ValueError:
+        return response.status_code, response.text
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send signed Cal.com webhooks")
+    parser.add_argument("--url", default="http://localhost:3020/api/webhooks/calcom")
+    parser.add_argument("--secret", default=os.getenv("CALCOM_WEBHOOK_SECRET"))
+    parser.add_argument("--trigger", choices=sorted(TRIGGERS), default="created")
+    parser.add_argument("--email", default="loadtest@example.com")
+    parser.add_argument("--start", help="UTC start, default: next full hour")
+    parser.add_argument("--minutes", type=int, default=30)
+    parser.add_argument(
+        "--previous-start", help="Original start of a rescheduled booking"
+    )
+    parser.add_argument("--event-type-id", type=int, default=2935831)
+    parser.add_argument("--uid", default=None)
+    parser.add_argument(
+        "--bad-signature",
+        action="store_true",
+        help="Sign with a wrong secret, to check that deliveries are rejected",
+    )
+    args = parser.parse_args()
+
+    if not args.secret:
+        parser.error("--secret (or CALCOM_WEBHOOK_SECRET) is required")
+
+    if args.start:
+        start = datetime.fromisoformat(args.start).astimezone(timezone.utc)
+    else:
+        start = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        ) + timedelta(hours=1)
+
+    def booking_at(start, uid):
+        return {
+            "uid": uid,
+            "title": f"{args.minutes} min meeting",
+            "eventTypeId": args.event_type_id,
+            "start": _iso(start),
+            "end": _iso(start + timedelta(minutes=args.minutes)),
+            "attendees": [
+                {"name": "Webhook Test", "email": args.email, "timeZone": "UTC"}
+            ],
+        }
+
+    trigger = TRIGGERS[args.trigger]
+    booking = booking_at(start, args.uid or uuid.uuid4().hex[:22])
+    previous = None
+    if trigger == "BOOKING_RESCHEDULED":
+        previous_start = (
+            datetime.fromisoformat(args.previous_start).astimezone(timezone.utc)
+            if args.previous_start
+            else start - timedelta(days=1)
+        )
+        previous = booking_at(previous_start, uuid.uuid4().hex[:22])
+
+    event = build_event(trigger, booking, previous)
+    secret = args.secret + "-wrong" if args.bad_signature else args.secret
+    status, body = send_event(args.url, secret, event)
+    print(f"{trigger} -> HTTP {status}: {json.dumps(body)}")
+    sys.exit(0 if status < 400 else 1)
+
+
+if __name__ == "__main__":
+    main()
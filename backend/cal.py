@@ -1,13 +1,46 @@
 # System imports
+import contextvars
+import os
+import threading
 import time
 import requests
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    wait,
+)
 
 # Logging imports
 from loguru import logger
+from utils.log import Truncated, payload_logger
 
 # Utils imports
 from enum import Enum
-from utils.datetime import convert_to_utc_format, get_day_range_utc
+from utils.cache import LRUCache, TaggedTTLCache
+from utils.circuit import CircuitBreaker, CircuitOpenError
+from utils.concurrency import SingleFlight
+from utils.deadline import get_deadline
+from utils.datetime import (
+    convert_many_to_utc_format,
+    convert_to_utc_format,
+    get_day_range_utc,
+    get_utc_dates,
+)
+from utils.hedging import HedgingPolicy
+from utils.idempotency import IdempotencyStore
+from utils.ratelimit import TokenBucket
+from utils.metrics import (
+    CACHE_HITS,
+    CALCOM_CALL_LATENCY,
+    CALCOM_RETRIES,
+    FUNCTION_RETURN_CODES,
+    timed,
+)
+from utils.retry import RetryPolicy, parse_retry_after
+from utils.tracing import span, traced
+from utils.transport import transport_from_env
 
 
 # Function return status and code enums
@@ -33,6 +66,11 @@ class FunctionReturnCode(Enum):
     BOOKING_NOT_FOUND = "booking_not_found"
     BOOKING_CANCELLATION_FAILED = "booking_cancellation_failed"
     #
+    BULK_COMPLETED = "bulk_completed"
+    BULK_PARTIALLY_FAILED = "bulk_partially_failed"
+    BULK_TOO_MANY_ITEMS = "bulk_too_many_items"
+    DRY_RUN = "dry_run"
+    #
     UNKNOWN = "unknown"
 
 
@@ -42,8 +80,10 @@ def function_return(
     result_code: FunctionReturnCode,
     result_message: str,
     result_data: dict,
+    stale: bool = False,
 ) -> dict:  # function return template for this class
-    return {
+    FUNCTION_RETURN_CODES.labels(status.value, result_code.value).inc()
+    result = {
         "status": status.value,
         "result": {
             "code": result_code.value,
@@ -51,22 +91,72 @@ def function_return(
             "data": result_data,
         },
     }
+    if stale:
+        # Data was served from cache because Cal.com is currently unavailable
+        result["result"]["stale"] = True
+    return result
+
+
+# Score of an exact event type title/slug match (containment scores are <= 1)
+EXACT_MATCH_SCORE = 2.0
+
+# Cal.com webhook triggers that change bookings (and therefore availability)
+WEBHOOK_BOOKING_TRIGGERS = (
+    "BOOKING_CREATED",
+    "BOOKING_CANCELLED",
+    "BOOKING_RESCHEDULED",
+)
+
+
+def event_match_score(event_name_lower, event):
+    """
+    How well an event type matches a (lowercased) name: EXACT_MATCH_SCORE for
+    an exact title/slug match, otherwise a containment score in [0, 1]
+    """
+    title = event["title"].lower()
+    slug = event["slug"].lower()
+
+    if event_name_lower == title or event_name_lower == slug:
+        return EXACT_MATCH_SCORE
+
+    score = 0
+    # Check if event name is contained in title or slug
+    if event_name_lower in title or event_name_lower in slug:
+        score = len(event_name_lower) / max(len(title), len(slug))
+    # Check if title/slug is contained in event name
+    if title in event_name_lower or slug in event_name_lower:
+        score = max(score, len(title) / len(event_name_lower))
+    return score
 
 
 class CalComTool:
     """
     CalComTool class for interacting with the Cal.com API
-    - @TODO: Add flag to disable logging in production
+    - Bookings are made on the calendar of `user_name`, by default the owner of
+      the API key (looked up when the key is validated)
+    - Each instance has its own connection pool, rate limiter and caches, so
+      one per host (tenant) can share a process (see tools/tenants.py)
+    - Logging is configured by environment (LOG_LEVEL etc., see utils/log.py)
     """
 
-    def __init__(self, api_key=None):
+    def __init__(
+        self,
+        api_key=None,
+        user_name=None,
+        validate_api_key=True,
+        transport=None,
+        webhook_secret=None,
+    ):
         logger.debug("Initializing CalComTool...")
 
         if not api_key:
             # An API key must be presented to continue
             raise ValueError("Please provide a Cal.com API Key.")
 
-        self.api_endpoint_prefix = "https://api.cal.com/v2/"
+        # Can be pointed at a local stand-in (see benchmarks/fake_calcom.py)
+        self.api_endpoint_prefix = os.getenv(
+            "CALCOM_API_BASE_URL", "https://api.cal.com/v2/"
+        )
         self.api_key = api_key
         self.default_api_version = "2024-06-14"
         self.headers = {
@@ -75,19 +165,145 @@ class CalComTool:
             "cal-api-version": self.default_api_version,
         }
 
-        # Check if the API key is valid on instantiation
-        if not self.is_api_validity():
-            raise ValueError("The Cal.com API Key provided is not valid.")
+        # HTTP transport with the `requests.request` signature: live by default,
+        # or recording to / replaying from a cassette (see utils/transport.py).
+        # Live requests go through this instance's own keep-alive connection pool.
+        self.session = None
+        if transport is None:
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=int(os.getenv("CALCOM_POOL_MAXSIZE", "16"))
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self.transport = transport or transport_from_env(session=self.session)
+
+        # Share one in-flight upstream request between concurrent identical GETs
+        self.coalesce_gets = os.getenv("CALCOM_COALESCE_GETS", "1") != "0"
+        self.get_singleflight = SingleFlight()
+
+        # Shared retry policy and per-attempt timeouts for every Cal.com call
+        self.retry_policy = RetryPolicy.from_env()
+        self.connect_timeout = float(os.getenv("CALCOM_CONNECT_TIMEOUT", "3.05"))
+        self.read_timeout = float(os.getenv("CALCOM_READ_TIMEOUT", "10"))
+
+        # Requests per minute allowed by Cal.com for an API key, shared by all
+        # threads; calls wait up to CALCOM_RATE_LIMIT_MAX_WAIT for a token
+        self.rate_limiter = TokenBucket.from_env("calcom", "CALCOM_RATE_LIMIT_")
+        self.rate_limit_max_wait = float(os.getenv("CALCOM_RATE_LIMIT_MAX_WAIT", "10"))
+
+        # One circuit breaker per Cal.com endpoint (event-types, slots, bookings, me)
+        self.circuit_breakers = {}
+        self._circuit_breakers_lock = threading.Lock()
+
+        # Optional hedging of slow GETs: a duplicate request is sent once a read
+        # outlives the endpoint's recent latency percentile (never for POSTs)
+        self.hedge_gets = os.getenv("CALCOM_HEDGE_GETS", "0") == "1"
+        self.hedging_policy = HedgingPolicy.from_env()
+        self.hedge_executor = (
+            ThreadPoolExecutor(
+                max_workers=int(os.getenv("CALCOM_HEDGE_WORKERS", "16")),
+                thread_name_prefix="calcom-hedge",
+            )
+            if self.hedge_gets
+            else None
+        )
 
-        logger.debug("Cal.com API Key successfully loaded")
+        # Last good response of each cacheable read, served flagged as stale
+        # when the endpoint is failing or its circuit is open
+        self.stale_cache = LRUCache(
+            maxsize=int(os.getenv("CALCOM_STALE_CACHE_SIZE", "256"))
+        )
+
+        # Fresh reads of event types, bookings (per attendee) and slots (per UTC
+        # day), dropped as soon as a booking changes, either through this tool
+        # or through a Cal.com webhook (see `apply_webhook_event`). Without
+        # webhooks, changes made elsewhere go unnoticed until expiry, so the TTLs
+        # default to 0 (no caching) unless this host has a webhook secret, or the
+        # background refresher keeps the entries warm (see tools/refresher.py),
+        # in which case they outlive two refresh cycles.
+        self.read_cache = TaggedTTLCache(
+            maxsize=int(os.getenv("CALCOM_READ_CACHE_SIZE", "1024"))
+        )
+        if webhook_secret:
+            default_read_ttl = "300"
+        elif os.getenv("CALCOM_REFRESH_ENABLED", "0") == "1":
+            default_read_ttl = str(
+                2 * float(os.getenv("CALCOM_REFRESH_INTERVAL", "60"))
+            )
+        else:
+            default_read_ttl = "0"
+        self.event_types_cache_ttl = float(
+            os.getenv("CALCOM_EVENT_TYPES_CACHE_TTL", default_read_ttl)
+        )
+        self.bookings_cache_ttl = float(
+            os.getenv("CALCOM_BOOKINGS_CACHE_TTL", default_read_ttl)
+        )
+        self.slots_cache_ttl = float(
+            os.getenv("CALCOM_SLOTS_CACHE_TTL", default_read_ttl)
+        )
 
-        # Use the same owner just for demo purpose
-        # We are only going to book a meeting with the same person
-        self.user_id = 1650861
-        self.user_name = "tommyjtl"
+        # Bookings made per event type (through this tool or seen in webhooks),
+        # which decides whose availability is kept warm
+        self.booking_counts = Counter()
+        self._booking_counts_lock = threading.Lock()
+
+        # Identical booking requests (same event type, start and attendee) made
+        # while the first is in flight, or within a few seconds of it, return the
+        # first booking instead of creating another. The window stays short: a
+        # booking cancelled in Cal.com directly must be bookable again, and
+        # retried chat turns are covered by the chat's Idempotency-Key.
+        self.booking_idempotency = IdempotencyStore(
+            "calcom_bookings",
+            maxsize=int(os.getenv("CALCOM_BOOKING_DEDUP_SIZE", "1024")),
+            ttl=float(os.getenv("CALCOM_BOOKING_DEDUP_TTL", "5")),
+        )
+
+        # Booking pipeline: slots of the most likely event types (going by the
+        # last known event types) are fetched while the name is being resolved
+        self.slot_prefetch_candidates = int(
+            os.getenv("CALCOM_SLOT_PREFETCH_CANDIDATES", "2")
+        )
+        self.pipeline_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("CALCOM_PIPELINE_WORKERS", "8")),
+            thread_name_prefix="calcom-pipeline",
+        )
+
+        # Bulk operations: items run this many at a time (still under the shared
+        # rate limit), on their own pool as each item may use the pipeline pool
+        self.bulk_max_items = int(os.getenv("CALCOM_BULK_MAX_ITEMS", "100"))
+        self.bulk_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("CALCOM_BULK_CONCURRENCY", "4")),
+            thread_name_prefix="calcom-bulk",
+        )
+
+        # Host whose calendar is booked: given (per tenant, see tools/tenants.py)
+        # or the key's owner. Never taken from the environment here, so a
+        # tenant can't end up acting on another tenant's calendar.
+        self.user_id = None
+        self.user_name = user_name
+
+        # Check if the API key is valid on instantiation (skipped for offline use)
+        if validate_api_key:
+            profile = self.get_my_profile()
+            if not self.is_api_validity(profile):
+                raise ValueError("The Cal.com API Key provided is not valid.")
+
+            profile_data = profile.get("data") or {}
+            self.user_id = profile_data.get("id")
+            self.user_name = self.user_name or profile_data.get("username")
+            if not self.user_name:
+                raise ValueError(
+                    "No Cal.com username for this API key, configure one for the tenant."
+                )
+            logger.debug("Cal.com API Key successfully loaded")
 
-    def is_api_validity(self):
-        response = self.get_my_profile()
+        if not self.user_name:
+            logger.warning("No Cal.com username known, event types can't be listed")
+
+    def is_api_validity(self, response=None):
+        if response is None:
+            response = self.get_my_profile()
         # {
         #   'status': 'error',
         #   'error': '401 Client Error: Unauthorized for url: https://api.cal.com/v2/me'
@@ -96,86 +312,475 @@ class CalComTool:
             return False
         return True
 
-    def get_request(self, action, params=None, sub_path="", api_version=None):
+    def get_request(
+        self,
+        action,
+        params=None,
+        sub_path="",
+        api_version=None,
+        allow_stale=False,
+        cache_ttl=0,
+        cache_tags=(),
+        refresh=False,
+    ):
+        """
+        GET from Cal.com. With `cache_ttl`, a response cached less than that many
+        seconds ago is returned without a request; `refresh` skips the lookup but
+        still caches the new response.
+        """
         full_endpoint_url = f"{self.api_endpoint_prefix}{action}{sub_path}"
         headers = self.headers.copy()  # Create a copy to avoid mutation
 
         if api_version != None:
             headers["cal-api-version"] = api_version
 
-        try:
-            if params == None:
-                response = requests.get(full_endpoint_url, headers=headers)
-            else:
-                response = requests.get(
-                    full_endpoint_url, headers=headers, params=params
-                )
+        # Identical GETs (same url, params and api version) share this key
+        key = self._get_request_key(
+            full_endpoint_url, params, headers["cal-api-version"]
+        )
 
-            # Add a small delay to avoid rate limiting
-            time.sleep(0.1)
+        if cache_ttl > 0:
+            cached = None if refresh else self.read_cache.get(key, cache_ttl)
+            if cached is not None:
+                CACHE_HITS.labels("calcom_read").inc()
+                return cached
+            # Taken before sending, so a response racing an invalidation isn't kept
+            generation = self.read_cache.generation(cache_tags)
+
+        def send():
+            return self._send(
+                "GET", full_endpoint_url, headers, endpoint=action, params=params
+            )
 
-            response.raise_for_status()  # Raise an exception for bad status codes
-            return response.json()
+        if self.coalesce_gets:
+            response = self.get_singleflight.do(key, send)
+        else:
+            response = send()
+
+        if cache_ttl > 0 and "error" not in response:
+            self.read_cache.set(key, response, cache_tags, generation=generation)
+
+        if not allow_stale:
+            return response
+
+        if "error" not in response:
+            self.stale_cache.set(key, response)
+            return response
+
+        # Upstream failed: fall back to the last good response if we have one
+        cached, age = self.stale_cache.get_with_age(key)
+        if cached is None:
+            return response
+        CACHE_HITS.labels("calcom_stale").inc()
+        logger.warning(
+            "Serving stale {} response ({:.0f}s old): {}",
+            action,
+            age,
+            response["error"],
+        )
+        return {**cached, "stale": True, "stale_age_seconds": round(age, 1)}
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            return {"status": "error", "error": str(e)}
+    def _get_request_key(self, full_endpoint_url, params, api_version):
+        return (
+            full_endpoint_url,
+            tuple(sorted(params.items())) if params else None,
+            api_version,
+        )
+
+    def get_cached_response(self, action, params=None, sub_path="", api_version=None):
+        """
+        Last good response of a cacheable read (see `allow_stale`) without sending
+        a request, or None if there is none
+        """
+        full_endpoint_url = f"{self.api_endpoint_prefix}{action}{sub_path}"
+        key = self._get_request_key(
+            full_endpoint_url, params, api_version or self.default_api_version
+        )
+        return self.stale_cache.peek(key)
 
-    def post_request(self, action, payload, sub_path="", api_version=None):
+    def post_request(
+        self, action, payload, sub_path="", api_version=None, idempotent=False
+    ):
         full_endpoint_url = f"{self.api_endpoint_prefix}{action}{sub_path}"
         headers = self.headers.copy()  # Create a copy to avoid mutation
 
         if api_version != None:
             headers["cal-api-version"] = api_version
 
+        return self._send(
+            "POST",
+            full_endpoint_url,
+            headers,
+            endpoint=action,
+            payload=payload,
+            idempotent=idempotent,
+        )
+
+    def _get_circuit_breaker(self, endpoint):
+        name = endpoint.split("/")[0]  # e.g. "bookings/<uid>/cancel" -> "bookings"
+        with self._circuit_breakers_lock:
+            if name not in self.circuit_breakers:
+                self.circuit_breakers[name] = CircuitBreaker.from_env(
+                    f"calcom:{name}", prefix="CALCOM_CIRCUIT_"
+                )
+            return self.circuit_breakers[name]
+
+    def _send(
+        self,
+        method,
+        full_endpoint_url,
+        headers,
+        endpoint,
+        params=None,
+        payload=None,
+        idempotent=True,
+    ):
+        """
+        Send a request through the endpoint's circuit breaker.
+        While the circuit is open the call fails fast without touching the network.
+        """
+        deadline_at = get_deadline()
+        if deadline_at is not None and deadline_at <= time.monotonic():
+            # Our own budget ran out, which says nothing about the upstream
+            logger.warning("Request deadline exceeded before {}", full_endpoint_url)
+            return {"status": "error", "error": "Request deadline exceeded"}
+
+        breaker = self._get_circuit_breaker(endpoint)
         try:
-            response = requests.post(
+            breaker.before_call()
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            return {"status": "error", "error": str(e), "circuit_open": True}
+
+        try:
+            response, upstream_healthy = self._send_with_retries(
+                method, full_endpoint_url, headers, params, payload, idempotent, breaker
+            )
+        except BaseException:
+            breaker.record_failure()
+            raise
+
+        if upstream_healthy is None:
+            # Nothing reached Cal.com: free the slot (e.g. a half-open probe)
+            # without a verdict on the upstream
+            breaker.release()
+        elif upstream_healthy:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return response
+
+    def _send_with_retries(
+        self, method, full_endpoint_url, headers, params, payload, idempotent, breaker
+    ):
+        """
+        Send a request under the shared retry policy.
+        Idempotent requests are retried on connection errors, timeouts and
+        transient status codes. Non-idempotent requests (e.g. creating a booking)
+        are only retried when the server cannot have acted on them: a connect
+        timeout, or a 429 rejection.
+        Attempts never outlive the deadline of the request being served (see
+        utils/deadline.py), if any.
+        Returns (response, upstream_healthy); upstream_healthy is None when no
+        attempt reached Cal.com.
+        """
+        started_at = time.monotonic()
+        deadline_at = get_deadline()
+        attempt = 0
+
+        while True:
+            retry_after = None
+            remaining = self.retry_policy.remaining(started_at, deadline_at)
+            timeout = (
+                min(self.connect_timeout, max(0.1, remaining)),
+                max(0.1, min(self.read_timeout, remaining)),
+            )
+            if not self.rate_limiter.acquire(
+                timeout=min(self.rate_limit_max_wait, remaining)
+            ):
+                # Our own budget: only an earlier failed attempt says anything
+                # about the upstream
+                logger.warning(
+                    "Cal.com rate limit budget exhausted for {}", full_endpoint_url
+                )
+                return {
+                    "status": "error",
+                    "error": "Cal.com rate limit budget exhausted",
+                }, (False if attempt else None)
+
+            try:
+                if method == "GET" and self.hedge_gets:
+                    response = self._hedged_get(
+                        breaker.name, full_endpoint_url, headers, params, timeout
+                    )
+                else:
+                    response = self.transport(
+                        method,
+                        full_endpoint_url,
+                        headers=headers,
+                        params=params,
+                        json=payload,
+                        timeout=timeout,
+                    )
+
+                retryable = response.status_code in (
+                    self.retry_policy.retryable_status_codes
+                ) and (idempotent or response.status_code == 429)
+                if not retryable:
+                    response.raise_for_status()  # Raise an exception for bad status codes
+                    return response.json(), True
+
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                try:
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError as e:
+                    failure = e
+
+            except requests.exceptions.Timeout as e:
+                connect_timed_out = isinstance(e, requests.exceptions.ConnectTimeout)
+                if remaining < (
+                    self.connect_timeout if connect_timed_out else self.read_timeout
+                ):
+                    # The timeout was cut to fit the deadline, so it says nothing
+                    # about Cal.com (else any client could open the circuit with
+                    # a tiny X-Request-Timeout); only an earlier attempt counts
+                    logger.warning(
+                        "Request deadline exceeded during {}", full_endpoint_url
+                    )
+                    return {"status": "error", "error": "Request deadline exceeded"}, (
+                        False if attempt else None
+                    )
+                if not (idempotent or connect_timed_out):
+                    logger.error("Request failed: {}", e)
+                    return {"status": "error", "error": str(e)}, False
+                failure = e
+            except requests.exceptions.ConnectionError as e:
+                if not idempotent:
+                    logger.error("Request failed: {}", e)
+                    return {"status": "error", "error": str(e)}, False
+                failure = e
+            except requests.exceptions.RequestException as e:
+                logger.error("Request failed: {}", e)
+                # Client errors (4xx) say nothing about the upstream's health
+                status_code = getattr(e.response, "status_code", None)
+                upstream_healthy = status_code is not None and status_code < 500
+                return {"status": "error", "error": str(e)}, upstream_healthy
+
+            delay = self.retry_policy.next_delay(
+                attempt, started_at, retry_after, deadline_at
+            )
+            if delay is None:
+                logger.error(
+                    "Request failed after {} attempt(s): {}", attempt + 1, failure
+                )
+                return {"status": "error", "error": str(failure)}, False
+
+            logger.warning(
+                "{} {} attempt {} failed ({}), retrying in {:.2f}s",
+                method,
+                full_endpoint_url,
+                attempt + 1,
+                failure,
+                delay,
+            )
+            CALCOM_RETRIES.labels(breaker.name).inc()
+            time.sleep(delay)
+            attempt += 1
+
+    def _hedged_get(self, endpoint, full_endpoint_url, headers, params, timeout):
+        """
+        Issue a GET and, if it is slower than the endpoint's hedge delay and the
+        hedging budget allows, a duplicate one. The first successful response wins;
+        the slower request is left to finish in the background.
+        """
+        tracker = self.hedging_policy.tracker(endpoint)
+
+        def attempt():
+            started_at = time.monotonic()
+            response = self.transport(
+                "GET",
                 full_endpoint_url,
                 headers=headers,
-                json=payload,
+                params=params,
+                timeout=timeout,
+            )
+            tracker.record(time.monotonic() - started_at)
+            return response
+
+        delay = self.hedging_policy.hedge_delay(endpoint)
+        if delay is None:
+            # Not enough latency samples yet, send it inline
+            return attempt()
+
+        primary = self.hedge_executor.submit(attempt)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+
+        if not (self.hedging_policy.try_acquire() and self.rate_limiter.try_acquire()):
+            return primary.result()
+
+        logger.debug("Hedging GET {} after {:.3f}s", full_endpoint_url, delay)
+        hedge = self.hedge_executor.submit(attempt)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self.hedging_policy.record_win()
+                    return future.result()
+
+        # Both requests failed, surface the primary's error
+        return primary.result()
+
+    def close_connections(self):
+        """
+        Close the pooled keep-alive connections (they are reopened on demand),
+        e.g. before forking so that no socket is shared between processes
+        """
+        if self.session is not None:
+            self.session.close()
+
+    def get_transport_stats(self):
+        """
+        Counters describing how upstream requests were served
+        """
+        return {
+            "coalescing": self.get_singleflight.stats(),
+            "retry": self.retry_policy.stats(),
+            "circuit_breakers": {
+                name: breaker.stats()
+                for name, breaker in list(self.circuit_breakers.items())
+            },
+            "rate_limiter": self.rate_limiter.stats(),
+            "stale_cache": self.stale_cache.stats(),
+            "read_cache": self.read_cache.stats(),
+            "booking_idempotency": self.booking_idempotency.stats(),
+            "hedging": self.hedging_policy.stats() if self.hedge_gets else None,
+        }
+
+    def invalidate_booking_caches(self, emails=(), times=(), everything=False):
+        """
+        Drop cached reads a booking change makes outdated: the bookings of its
+        attendees and the slots of the UTC days it covers (`times` holds
+        (start, end) pairs, end may be None). Returns the number of entries dropped.
+        """
+        if everything:
+            return self.read_cache.invalidate("bookings") + self.read_cache.invalidate(
+                "slots"
+            )
+
+        tags = {("bookings", email.lower()) for email in emails if email}
+        for start, end in times:
+            if not start:
+                continue
+            try:
+                tags.update(("slots", day) for day in get_utc_dates(start, end))
+            except ValueError:
+                # Can't tell which days are affected
+                tags.add("slots")
+        return sum(self.read_cache.invalidate(tag) for tag in tags)
+
+    def record_booking(self, event_type_id):
+        if event_type_id is None:
+            return
+        with self._booking_counts_lock:
+            self.booking_counts[event_type_id] += 1
+
+    def most_booked_event_type_ids(self, limit):
+        """
+        Up to `limit` event type ids with the most bookings, topped up with the
+        last known event types (in Cal.com's order) while there is no history
+        """
+        with self._booking_counts_lock:
+            ids = [
+                event_type_id
+                for event_type_id, _ in self.booking_counts.most_common(limit)
+            ]
+        if len(ids) < limit:
+            response = self.get_cached_response(
+                "event-types", params={"username": self.user_name}
+            )
+            for event in (response or {}).get("data") or []:
+                if len(ids) >= limit:
+                    break
+                if event.get("id") not in ids:
+                    ids.append(event["id"])
+        return ids
+
+    def apply_webhook_event(self, event):
+        """
+        Update caches from a (verified) Cal.com webhook event; returns a summary,
+        or None for triggers that don't affect any cache.
+        https://cal.com/docs/developing/guides/automation/webhooks
+        """
+        trigger = event.get("triggerEvent")
+        if trigger not in WEBHOOK_BOOKING_TRIGGERS:
+            return None
+
+        payload = event.get("payload") or {}
+        emails = [attendee.get("email") for attendee in payload.get("attendees") or []]
+        times = [(payload.get("startTime"), payload.get("endTime"))]
+        if trigger == "BOOKING_RESCHEDULED":
+            # The original time is free again
+            times.append(
+                (payload.get("rescheduleStartTime"), payload.get("rescheduleEndTime"))
             )
 
-            # Add a small delay to avoid rate limiting
-            time.sleep(0.1)
+        if any(emails) and payload.get("startTime"):
+            invalidated = self.invalidate_booking_caches(emails, times)
+        else:
+            # Not enough detail to narrow it down
+            invalidated = self.invalidate_booking_caches(everything=True)
 
-            response.raise_for_status()  # Raise an exception for bad status codes
-            return response.json()
+        if trigger == "BOOKING_CREATED":
+            self.record_booking(payload.get("eventTypeId"))
+
+        # A cancelled (or moved) booking must not be replayed to a new request
+        gone_uid = payload.get(
+            "rescheduleUid" if trigger == "BOOKING_RESCHEDULED" else "uid"
+        )
+        if trigger != "BOOKING_CREATED" and gone_uid:
+            self.booking_idempotency.discard_where(
+                lambda booking: (booking.get("data") or {}).get("uid") == gone_uid
+            )
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            return {"status": "error", "error": str(e)}
+        logger.info(
+            "Cal.com webhook {} for booking {}: {} cached reads invalidated",
+            trigger,
+            payload.get("uid"),
+            invalidated,
+        )
+        return {"trigger": trigger, "invalidated": invalidated}
 
     """
     Cal.com API Wrappers
     """
 
-    def get_all_event_types(self):
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
+    def get_all_event_types(self, refresh=False):
         # https://cal.com/docs/api-reference/v2/event-types/get-all-event-types
 
         action = "event-types"
+        if not self.user_name:
+            # Event types are listed per username, never guess one
+            return {"status": "error", "error": "No Cal.com username configured"}
         params = {"username": self.user_name}
 
-        # Retry logic in case of endpoint error
-        max_retries = 3  # Allow at most 3 tries
-        for attempt in range(max_retries):
-
-            try:
-                result = self.get_request(action, params=params)
-                if "error" not in result:
-                    return result
-                logger.warning(f"Attempt {attempt + 1} failed: {result.get('error')}")
-                if attempt < max_retries - 1:
-                    time.sleep(0.5 * (attempt + 1))  # Exponential backoff
-
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed with exception: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(0.5 * (attempt + 1))
-                else:
-                    return {"status": "error", "error": str(e)}
-
-        return result
+        return self.get_request(
+            action,
+            params=params,
+            allow_stale=True,
+            cache_ttl=self.event_types_cache_ttl,
+            cache_tags=["event-types"],
+            refresh=refresh,
+        )
 
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
     def create_an_event_type(self, length_in_minutes, title, slug):
         # https://cal.com/docs/api-reference/v2/event-types/create-an-event-type
 
@@ -201,8 +806,13 @@ class CalComTool:
             "locations": [{"type": "integration", "integration": "google-meet"}],
         }
 
-        return self.post_request(action, payload=payload)
+        response = self.post_request(action, payload=payload)
+        if response.get("status") == "success":
+            self.read_cache.invalidate("event-types")
+        return response
 
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
     def get_an_event_type(self, event_type_id):
         # https://cal.com/docs/api-reference/v2/event-types/get-an-event-type
 
@@ -211,14 +821,30 @@ class CalComTool:
 
         return self.get_request(action, sub_path=sub_path)
 
-    def get_available_time_slots(self, event_type_id, start, end):
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
+    def get_available_time_slots(self, event_type_id, start, end, refresh=False):
         # https://cal.com/docs/api-reference/v2/slots/get-available-time-slots-for-an-event-type
 
         action = "slots"
         params = {"eventTypeId": event_type_id, "start": start, "end": end}
 
-        return self.get_request(action, params=params, api_version="2024-09-04")
+        return self.get_request(
+            action,
+            params=params,
+            api_version="2024-09-04",
+            cache_ttl=self.slots_cache_ttl,
+            # Event types share the host's calendar, so a booking changes the
+            # availability of every event type on its day(s)
+            cache_tags=[
+                "slots",
+                *(("slots", day) for day in get_utc_dates(start, end)),
+            ],
+            refresh=refresh,
+        )
 
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
     def create_a_booking(
         self,
         start_datetime,
@@ -243,26 +869,57 @@ class CalComTool:
             # "metadata": {}, # no additional key-value pairs needed at the moment
         }
 
-        return self.post_request(action, payload, api_version="2024-08-13")
+        # Concurrent duplicates (e.g. a repeated tool call) must not create the
+        # same booking twice
+        response, replayed = self.booking_idempotency.run(
+            (event_type_id, start_datetime, email.lower()),
+            lambda: self.post_request(action, payload, api_version="2024-08-13"),
+            should_store=lambda response: response.get("status") == "success",
+        )
+        if replayed:
+            logger.info(
+                "Duplicate booking request for event type {} at {}, returning the existing booking",
+                event_type_id,
+                start_datetime,
+            )
+        elif response.get("status") == "success":
+            self.record_booking(event_type_id)
+            self.invalidate_booking_caches([email], [(start_datetime, None)])
+        return response
 
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
     def get_all_bookings(
         self,
         attendee_email,
         status="upcoming",
+        take=20,
+        skip=0,
         #  event_type_ids=[] # we aren't using this for this demo
     ):
         # https://cal.com/docs/api-reference/v2/bookings/get-all-bookings
 
         action = "bookings"
         params = {
-            "take": "20",
+            "take": str(take),
             "sortStart": "asc",
             "status": status,
             "attendeeEmail": attendee_email,
         }
+        if skip:
+            params["skip"] = str(skip)
+
+        return self.get_request(
+            action,
+            params=params,
+            api_version="2024-08-13",
+            allow_stale=True,
+            cache_ttl=self.bookings_cache_ttl,
+            cache_tags=["bookings", ("bookings", attendee_email.lower())],
+        )
 
-        return self.get_request(action, params=params, api_version="2024-08-13")
-
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
     def cancel_a_booking(self, booking_uid: str):
         # https://cal.com/docs/api-reference/v2/bookings/cancel-a-booking
 
@@ -272,8 +929,27 @@ class CalComTool:
             "cancelSubsequentBookings": False,
         }
 
-        return self.post_request(action, payload, api_version="2024-08-13")
+        response = self.post_request(action, payload, api_version="2024-08-13")
+        if response.get("status") == "success":
+            # The slot can be booked again
+            self.booking_idempotency.discard_where(
+                lambda booking: (booking.get("data") or {}).get("uid") == booking_uid
+            )
+            booking = response.get("data") or {}
+            emails = [
+                attendee.get("email") for attendee in booking.get("attendees") or []
+            ]
+            if booking.get("start") and any(emails):
+                self.invalidate_booking_caches(
+                    emails, [(booking["start"], booking.get("end"))]
+                )
+            else:
+                # Not enough detail to narrow it down
+                self.invalidate_booking_caches(everything=True)
+        return response
 
+    @timed(CALCOM_CALL_LATENCY)
+    @traced("calcom.")
     def get_my_profile(self):
         return self.get_request("me")
 
@@ -281,17 +957,18 @@ class CalComTool:
     Functional call wrappers
     """
 
+    @traced("lookup.")
     def find_event_id_by_name(self, event_name):
         """
         Find the closest matching event type using simple string similarity.
         Returns the best matching event or an error if no match is found.
         """
-        logger.debug(f"Looking for event with name: {event_name}")
+        logger.debug("Looking for event with name: {}", event_name)
         response = self.get_all_event_types()
 
         # Check if the response has an error key (from our improved error handling)
         if "error" in response:
-            logger.error(f"API request failed: {response['error']}")
+            logger.error("API request failed: {}", response["error"])
             return function_return(
                 status=FunctionReturnStatus.ERROR,
                 result_code=FunctionReturnCode.CALCOM_API_REQUEST_FAILED,
@@ -310,7 +987,7 @@ class CalComTool:
 
         # Handle case where response doesn't have expected 'data' field
         if "data" not in response:
-            logger.error(f"Unexpected response format: {response}")
+            payload_logger.error("Unexpected response format: {}", Truncated(response))
             return function_return(
                 status=FunctionReturnStatus.ERROR,
                 result_code=FunctionReturnCode.UNEXPECTED_RESPONSE_FORMAT,
@@ -323,11 +1000,10 @@ class CalComTool:
         best_score = 0
 
         for event in response["data"]:
-            title = event["title"].lower()
-            slug = event["slug"].lower()
+            score = event_match_score(event_name_lower, event)
 
             # Exact match gets highest priority
-            if event_name_lower == title or event_name_lower == slug:
+            if score == EXACT_MATCH_SCORE:
                 return function_return(
                     status=FunctionReturnStatus.SUCCESS,
                     result_code=FunctionReturnCode.FOUND_MATCH,
@@ -337,21 +1013,12 @@ class CalComTool:
                         "slug": event["slug"],
                         "id": event["id"],
                     },
+                    stale=response.get("stale", False),
                 )
 
-            # Check if event name is contained in title or slug
-            if event_name_lower in title or event_name_lower in slug:
-                score = len(event_name_lower) / max(len(title), len(slug))
-                if score > best_score:
-                    best_score = score
-                    best_match = event
-
-            # Check if title/slug is contained in event name
-            if title in event_name_lower or slug in event_name_lower:
-                score = len(title) / len(event_name_lower)
-                if score > best_score:
-                    best_score = score
-                    best_match = event
+            if score > best_score:
+                best_score = score
+                best_match = event
 
         if best_match:
             return function_return(
@@ -363,6 +1030,7 @@ class CalComTool:
                     "slug": best_match["slug"],
                     "id": best_match["id"],
                 },
+                stale=response.get("stale", False),
             )
 
         event_type_ids = []
@@ -377,9 +1045,40 @@ class CalComTool:
             result_code=FunctionReturnCode.NO_MATCH,
             result_message=f"No matching event found for '{event_name}'",
             result_data=event_type_ids,
+            stale=response.get("stale", False),
+        )
+
+    def guess_event_type_ids(self, event_name, limit):
+        """
+        Most likely event type ids for a name, ranked against the last known
+        event types without sending a request (empty when none are cached)
+        """
+        response = self.get_cached_response(
+            "event-types", params={"username": self.user_name}
+        )
+        if not response or not isinstance(response.get("data"), list):
+            return []
+
+        event_name_lower = event_name.lower().strip()
+        scored = []
+        for event in response["data"]:
+            score = event_match_score(event_name_lower, event)
+            if score == EXACT_MATCH_SCORE:
+                return [event["id"]]
+            if score > 0:
+                scored.append((score, event["id"]))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [event_type_id for _, event_type_id in scored[:limit]]
+
+    def _submit(self, fn, *args, executor=None):
+        # Run on the pipeline pool within a copy of the caller's context, so
+        # spans (and the request's deadline) still apply
+        return (executor or self.pipeline_executor).submit(
+            contextvars.copy_context().run, fn, *args
         )
 
-    def create_a_cal_booking_fc(self):
+    @staticmethod
+    def create_a_cal_booking_fc():
         return {
             "type": "function",
             "function": {
@@ -427,6 +1126,7 @@ class CalComTool:
             },
         }
 
+    @traced("tool.")
     def create_a_cal_booking(
         self,
         event_name,
@@ -435,44 +1135,77 @@ class CalComTool:
         reason="This is an example reason for this booking",
         user_email="user@example.com",
         user_name="John Doe",
+        dry_run=False,
     ):
         """
         Create a booking for a user for a specific event at a given time.
-        Finds the event id by fuzzy matching the event name, then creates the booking.
+        Finds the event id by fuzzy matching the event name, then creates the booking
+        (with `dry_run`, stops short of it once the slot is known to be free).
+        Runs as a pipeline: the slots of the likeliest event types are prefetched
+        while the name is resolved against fresh event types, so the slot lookup
+        is usually already done once the event type is known.
         """
         logger.debug(
-            f"Starting booking creation for event: {event_name} at {datetime_start}"
+            "Starting booking creation for event: {} at {}", event_name, datetime_start
         )
 
+        # Convert datetime_start to UTC format (no dependency on the lookups)
+        datetime_start = convert_to_utc_format(datetime_start, timezone)
+        same_day_time_range = get_day_range_utc(datetime_start)
+
+        # Speculatively fetch the slots of the top candidate event types
+        prefetched_slots = {
+            event_type_id: self._submit(
+                self.get_available_time_slots,
+                event_type_id,
+                same_day_time_range["start"],
+                same_day_time_range["end"],
+            )
+            for event_type_id in self.guess_event_type_ids(
+                event_name, self.slot_prefetch_candidates
+            )
+        }
+
         # Find the event_type_id from the name extracted from user's input
         result = self.find_event_id_by_name(event_name)
-
-        # Convert datetime_start to UTC format
-        datetime_start = convert_to_utc_format(datetime_start, timezone)
+        event_type_id = (
+            result["result"]["data"]["id"] if result["status"] == "success" else None
+        )
+        for candidate_id, future in prefetched_slots.items():
+            if candidate_id != event_type_id:
+                future.cancel()  # a no-op once the request is in flight
 
         # if there's no match, we return the result directly
         if result["status"] == "error":
-            logger.debug(f"Event ID (by Name) lookup failed: {result}")
+            payload_logger.debug(
+                "Event ID (by Name) lookup failed: {}", Truncated(result)
+            )
             return result  # returning "no_match" with list of events available
 
         # if there's a match, proceed with find the availabilities for that event
         if result["status"] == "success":
-            # extract the event_type_id
-            event_type_id = result["result"]["data"]["id"]
-            same_day_time_range = get_day_range_utc(datetime_start)
-
             logger.debug(
-                f"Found event ID: {event_type_id}, checking availability for {same_day_time_range}"
+                "Found event ID: {}, checking availability for {}",
+                event_type_id,
+                same_day_time_range,
             )
 
-            # Add error handling for get_available_time_slots
-            available_slots = self.get_available_time_slots(
-                event_type_id, same_day_time_range["start"], same_day_time_range["end"]
-            )
+            # Use the prefetched slots if the guess was right, otherwise fetch them
+            if event_type_id in prefetched_slots:
+                with span("calcom.slots_prefetch_wait"):
+                    available_slots = prefetched_slots[event_type_id].result()
+            else:
+                available_slots = self.get_available_time_slots(
+                    event_type_id,
+                    same_day_time_range["start"],
+                    same_day_time_range["end"],
+                )
 
             # Check if the slots request failed
             if "error" in available_slots:
-                logger.error(f"Failed to get available slots: {available_slots}")
+                payload_logger.error(
+                    "Failed to get available slots: {}", Truncated(available_slots)
+                )
                 return function_return(
                     status=FunctionReturnStatus.ERROR,
                     result_code=FunctionReturnCode.SLOTS_REQUEST_FAILED,
@@ -480,7 +1213,9 @@ class CalComTool:
                     result_data=available_slots["error"],
                 )
 
-            logger.debug(f"Available slots response: {available_slots}")
+            payload_logger.debug(
+                "Available slots response: {}", Truncated(available_slots)
+            )
 
             # check if we have an exact match in the list by going through the available slots
             found_exact_match = False
@@ -490,6 +1225,16 @@ class CalComTool:
                     same_day_time_range["start"].split("T")[0], []
                 ):
                     if slot["start"] == datetime_start:
+                        if dry_run:
+                            return function_return(
+                                status=FunctionReturnStatus.SUCCESS,
+                                result_code=FunctionReturnCode.DRY_RUN,
+                                result_message=f"Would create a booking for '{event_name}' at {datetime_start}.",
+                                result_data={
+                                    "event_type_id": event_type_id,
+                                    "start": datetime_start,
+                                },
+                            )
                         # if we have an exact match, we create a booking
                         booking_response = self.create_a_booking(
                             start_datetime=datetime_start,
@@ -498,8 +1243,9 @@ class CalComTool:
                             email=user_email,
                             notes=reason,
                         )
-                        logger.debug(
-                            f"Exact match found, booking response: {booking_response}"
+                        payload_logger.debug(
+                            "Exact match found, booking response: {}",
+                            Truncated(booking_response),
                         )
                         return function_return(
                             status=FunctionReturnStatus.SUCCESS,
@@ -510,8 +1256,10 @@ class CalComTool:
 
             if not found_exact_match:
                 # if there's no exact match, we return the available slots
-                logger.debug(f"No exact match found, returning available slots:")
-                logger.debug(available_slots["data"])
+                payload_logger.debug(
+                    "No exact match found, returning available slots: {}",
+                    Truncated(available_slots["data"]),
+                )
                 return function_return(
                     status=FunctionReturnStatus.ERROR,
                     result_code=FunctionReturnCode.AVAILABILITY_NO_EXACT_MATCH,
@@ -526,7 +1274,8 @@ class CalComTool:
             result_data=result,
         )
 
-    def list_all_cal_bookings_fc(self):
+    @staticmethod
+    def list_all_cal_bookings_fc():
         return {
             "type": "function",
             "function": {
@@ -549,6 +1298,7 @@ class CalComTool:
             },
         }
 
+    @traced("tool.")
     def list_all_cal_bookings(
         self,
         user_email,
@@ -559,12 +1309,13 @@ class CalComTool:
         if result.get("status") == "success":
             # Check if the data array is empty (no bookings found)
             if not result.get("data") or len(result.get("data", [])) == 0:
-                logger.debug(f"No bookings found for {user_email}")
+                logger.debug("No bookings found for {}", user_email)
                 return function_return(
                     status=FunctionReturnStatus.SUCCESS,
                     result_code=FunctionReturnCode.LIST_ALL_CAL_BOOKINGS_EMPTY,
                     result_message=f"No bookings found for {user_email}",
                     result_data=[],
+                    stale=result.get("stale", False),
                 )
 
             # Process the bookings data
@@ -586,6 +1337,7 @@ class CalComTool:
                 result_code=FunctionReturnCode.LIST_ALL_CAL_BOOKINGS_SUCCESS,
                 result_message=f"Successfully retrived a list of bookings relevant to {user_email}",
                 result_data=bookings,
+                stale=result.get("stale", False),
             )
 
         return function_return(
@@ -595,7 +1347,8 @@ class CalComTool:
             result_data=result,
         )
 
-    def cancel_user_booking_fc(self):
+    @staticmethod
+    def cancel_user_booking_fc():
         return {
             "type": "function",
             "function": {
@@ -626,6 +1379,7 @@ class CalComTool:
             },
         }
 
+    @traced("tool.")
     def cancel_user_booking(
         self,
         user_email,
@@ -637,7 +1391,10 @@ class CalComTool:
         First finds the booking UID by matching name and datetime, then cancels it.
         """
         logger.debug(
-            f"Starting booking cancellation for: {booking_name} at {datetime_start} for {user_email}"
+            "Starting booking cancellation for: {} at {} for {}",
+            booking_name,
+            datetime_start,
+            user_email,
         )
 
         # # Add 5 seconds delay to allow newly created bookings to be available in the API
@@ -651,7 +1408,7 @@ class CalComTool:
 
         # If there's no match, return the result directly
         if result["status"] == "error":
-            logger.debug(f"Booking lookup failed: {result}")
+            payload_logger.debug("Booking lookup failed: {}", Truncated(result))
             return result  # returning error with list of available bookings
 
         # If there's a match, proceed with cancellation
@@ -660,7 +1417,7 @@ class CalComTool:
             booking_uid = result["result"]["data"]["uid"]
             booking_info = result["result"]["data"]
 
-            logger.debug(f"Found booking UID: {booking_uid}, attempting cancellation")
+            logger.debug("Found booking UID: {}, attempting cancellation", booking_uid)
 
             try:
                 # Cancel the booking using the API method
@@ -668,7 +1425,7 @@ class CalComTool:
 
                 # Check if cancellation was successful
                 if cancellation_response.get("status") == "success":
-                    logger.debug(f"Successfully cancelled booking: {booking_name}")
+                    logger.debug("Successfully cancelled booking: {}", booking_name)
                     return function_return(
                         status=FunctionReturnStatus.SUCCESS,
                         result_code=FunctionReturnCode.BOOKING_FOUND_AND_CANCELLED,
@@ -679,7 +1436,9 @@ class CalComTool:
                         },
                     )
                 else:
-                    logger.error(f"Failed to cancel booking: {cancellation_response}")
+                    payload_logger.error(
+                        "Failed to cancel booking: {}", Truncated(cancellation_response)
+                    )
                     return function_return(
                         status=FunctionReturnStatus.ERROR,
                         result_code=FunctionReturnCode.BOOKING_CANCELLATION_FAILED,
@@ -691,7 +1450,7 @@ class CalComTool:
                     )
 
             except Exception as e:
-                logger.error(f"Exception during booking cancellation: {e}")
+                logger.error("Exception during booking cancellation: {}", e)
                 return function_return(
                     status=FunctionReturnStatus.ERROR,
                     result_code=FunctionReturnCode.BOOKING_CANCELLATION_FAILED,
@@ -709,6 +1468,7 @@ class CalComTool:
             result_data=result,
         )
 
+    @traced("lookup.")
     def find_booking_uid_by_name_and_datetime(
         self, user_email, booking_name, datetime_start
     ):
@@ -717,7 +1477,9 @@ class CalComTool:
         Returns the matching booking UID or an error if no match is found.
         """
         logger.debug(
-            f"Looking for booking with name: {booking_name} and datetime: {datetime_start}"
+            "Looking for booking with name: {} and datetime: {}",
+            booking_name,
+            datetime_start,
         )
 
         # Convert datetime_start to UTC format for comparison
@@ -728,7 +1490,7 @@ class CalComTool:
 
         # Check if the response has an error key
         if "error" in response:
-            logger.error(f"API request failed: {response['error']}")
+            logger.error("API request failed: {}", response["error"])
             return function_return(
                 status=FunctionReturnStatus.ERROR,
                 result_code=FunctionReturnCode.CALCOM_API_REQUEST_FAILED,
@@ -747,7 +1509,7 @@ class CalComTool:
 
         # Handle case where response doesn't have expected 'data' field
         if "data" not in response:
-            logger.error(f"Unexpected response format: {response}")
+            payload_logger.error("Unexpected response format: {}", Truncated(response))
             return function_return(
                 status=FunctionReturnStatus.ERROR,
                 result_code=FunctionReturnCode.UNEXPECTED_RESPONSE_FORMAT,
@@ -757,19 +1519,27 @@ class CalComTool:
 
         booking_name_lower = booking_name.lower().strip()
 
-        for booking in response["data"]:
-            title = booking.get("title", "").lower()
-            start_time = booking.get("start", "")
+        # Only bookings with a matching title need their start time parsed
+        candidates = [
+            booking
+            for booking in response["data"]
+            if booking.get("title", "").lower() == booking_name_lower
+        ]
 
-            # Convert booking start time to UTC for comparison
-            try:
-                booking_start_utc = convert_to_utc_format(start_time)
-            except Exception as e:
-                logger.warning(f"Could not parse booking start time {start_time}: {e}")
+        # Convert booking start times to UTC for comparison, all at once
+        candidate_starts_utc = convert_many_to_utc_format(
+            [booking.get("start", "") for booking in candidates]
+        )
+
+        for booking, booking_start_utc in zip(candidates, candidate_starts_utc):
+            if booking_start_utc is None:
+                logger.warning(
+                    "Could not parse booking start time {}", booking.get("start", "")
+                )
                 continue
 
             # @TODO: User is not able to cancel booking right after creation - has to send mutiple requests
-            if booking_name_lower == title and datetime_start_utc == booking_start_utc:
+            if datetime_start_utc == booking_start_utc:
                 return function_return(
                     status=FunctionReturnStatus.SUCCESS,
                     result_code=FunctionReturnCode.FOUND_MATCH,
@@ -803,13 +1573,232 @@ class CalComTool:
             result_data=available_bookings,
         )
 
+    """
+    Bulk operations
+    """
+
+    def _run_bulk(self, fn, items):
+        """
+        Call `fn(item)` for every item, `bulk_executor`'s worth at a time, and
+        return the results in item order; an exception fails only its own item
+        """
+
+        def run(item):
+            try:
+                return fn(item)
+            except Exception as e:
+                logger.exception("Bulk item failed: {}", e)
+                return function_return(
+                    status=FunctionReturnStatus.ERROR,
+                    result_code=FunctionReturnCode.UNKNOWN,
+                    result_message=str(e),
+                    result_data=None,
+                )
+
+        futures = [
+            self._submit(run, item, executor=self.bulk_executor) for item in items
+        ]
+        return [future.result() for future in futures]
+
+    def _bulk_return(self, action, items, results, dry_run):
+        succeeded = sum(result["status"] == "success" for result in results)
+        failed = len(results) - succeeded
+        return function_return(
+            status=(
+                FunctionReturnStatus.SUCCESS
+                if not failed
+                else FunctionReturnStatus.ERROR
+            ),
+            result_code=(
+                FunctionReturnCode.BULK_COMPLETED
+                if not failed
+                else FunctionReturnCode.BULK_PARTIALLY_FAILED
+            ),
+            result_message=f"{'[Dry run] ' if dry_run else ''}{action}: "
+            + f"{succeeded} of {len(results)} succeeded, {failed} failed.",
+            result_data={
+                "dry_run": dry_run,
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": failed,
+                "items": [
+                    {"item": item, "status": result["status"], **result["result"]}
+                    for item, result in zip(items, results)
+                ],
+            },
+        )
+
+    def _too_many_items(self, count):
+        return function_return(
+            status=FunctionReturnStatus.ERROR,
+            result_code=FunctionReturnCode.BULK_TOO_MANY_ITEMS,
+            result_message=f"{count} items requested, at most {self.bulk_max_items} "
+            + "can be processed at once.",
+            result_data={"max_items": self.bulk_max_items},
+        )
+
+    @staticmethod
+    def bulk_create_cal_bookings_fc():
+        booking_spec = CalComTool.create_a_cal_booking_fc()["function"]["parameters"]
+        return {
+            "type": "function",
+            "function": {
+                "name": "bulk_create_cal_bookings",
+                "description": "Create several bookings/events at once, e.g. a series of meetings. "
+                + "Each booking is handled like create_a_cal_booking and reports its own result. "
+                + "Use dry_run to only check that every slot is available.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "bookings": {
+                            "type": "array",
+                            "description": "The bookings to create.",
+                            "items": booking_spec,
+                        },
+                        "dry_run": {
+                            "type": "boolean",
+                            "description": "If true, nothing is booked; only report what would happen.",
+                        },
+                    },
+                    "required": ["bookings", "dry_run"],
+                    "additionalProperties": False,
+                },
+                "strict": True,
+            },
+        }
+
+    @traced("tool.")
+    def bulk_create_cal_bookings(self, bookings, dry_run=False):
+        """
+        Create many bookings (see `create_a_cal_booking`) with bounded parallelism.
+        Every item reports its own result; one failing doesn't stop the others.
+        """
+        if len(bookings) > self.bulk_max_items:
+            return self._too_many_items(len(bookings))
+
+        logger.debug("Bulk creating {} booking(s), dry run: {}", len(bookings), dry_run)
+        results = self._run_bulk(
+            lambda booking: self.create_a_cal_booking(**booking, dry_run=dry_run),
+            bookings,
+        )
+        return self._bulk_return("Create bookings", bookings, results, dry_run)
+
+    @staticmethod
+    def bulk_cancel_user_bookings_fc():
+        return {
+            "type": "function",
+            "function": {
+                "name": "bulk_cancel_user_bookings",
+                "description": "Cancel all upcoming Cal.com bookings of a user at once, "
+                + "e.g. to clear their calendar. Use dry_run to list what would be cancelled.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "user_email": {
+                            "type": "string",
+                            "description": "The email of the user whose bookings to cancel.",
+                        },
+                        "dry_run": {
+                            "type": "boolean",
+                            "description": "If true, nothing is cancelled; only list the bookings that would be.",
+                        },
+                    },
+                    "required": ["user_email", "dry_run"],
+                    "additionalProperties": False,
+                },
+                "strict": True,
+            },
+        }
+
+    @traced("tool.")
+    def bulk_cancel_user_bookings(
+        self, user_email, dry_run=False, booking_uids=None, status="upcoming"
+    ):
+        """
+        Cancel all bookings of `user_email` with the given `status` (or only those
+        in `booking_uids`) with bounded parallelism, each reporting its own result
+        """
+        # Collect every page of bookings
+        bookings = []
+        page_size = 20
+        while len(bookings) <= self.bulk_max_items:
+            response = self.get_all_bookings(
+                attendee_email=user_email,
+                status=status,
+                take=page_size,
+                skip=len(bookings),
+            )
+            if "error" in response:
+                return function_return(
+                    status=FunctionReturnStatus.ERROR,
+                    result_code=FunctionReturnCode.CALCOM_API_REQUEST_FAILED,
+                    result_message="Failed to retrieve the bookings to cancel",
+                    result_data=response["error"],
+                )
+            page = response.get("data") or []
+            bookings.extend(page)
+            if len(page) < page_size:
+                break
+
+        if booking_uids is not None:
+            bookings = [
+                booking for booking in bookings if booking.get("uid") in booking_uids
+            ]
+        if len(bookings) > self.bulk_max_items:
+            return self._too_many_items(len(bookings))
+
+        items = [
+            {
+                "uid": booking.get("uid"),
+                "title": booking.get("title"),
+                "startTime": booking.get("start"),
+            }
+            for booking in bookings
+        ]
+        logger.debug(
+            "Bulk cancelling {} booking(s) of {}, dry run: {}",
+            len(items),
+            user_email,
+            dry_run,
+        )
+
+        def cancel(item):
+            if dry_run:
+                return function_return(
+                    status=FunctionReturnStatus.SUCCESS,
+                    result_code=FunctionReturnCode.DRY_RUN,
+                    result_message=f"Would cancel '{item['title']}' at {item['startTime']}",
+                    result_data=None,
+                )
+            response = self.cancel_a_booking(item["uid"])
+            if response.get("status") == "success":
+                return function_return(
+                    status=FunctionReturnStatus.SUCCESS,
+                    result_code=FunctionReturnCode.BOOKING_FOUND_AND_CANCELLED,
+                    result_message=f"Booking cancelled '{item['title']}' at {item['startTime']}",
+                    result_data=None,
+                )
+            return function_return(
+                status=FunctionReturnStatus.ERROR,
+                result_code=FunctionReturnCode.BOOKING_CANCELLATION_FAILED,
+                result_message=f"Failed to cancel: {response.get('error', 'Unknown error')}",
+                result_data=response,
+            )
+
+        results = self._run_bulk(cancel, items)
+        return self._bulk_return("Cancel bookings", items, results, dry_run)
+
     """
     Function Calling Tools
     """
 
-    def get_function_call_specs(self):
+    @classmethod
+    def get_function_call_specs(cls):
+        # The same for every instance (tenant)
         return [
-            self.cancel_user_booking_fc(),
-            self.list_all_cal_bookings_fc(),
-            self.create_a_cal_booking_fc(),
+            cls.cancel_user_booking_fc(),
+            cls.list_all_cal_bookings_fc(),
+            cls.create_a_cal_booking_fc(),
+            cls.bulk_create_cal_bookings_fc(),
+            cls.bulk_cancel_user_bookings_fc(),
         ]
@@ -100,42 +100,36 @@ def cancel_all_bookings(
         print("\nThis is a dry run. Set dry_run=False to actually cancel the bookings.")
         return {"cancelled": [], "failed": [], "total": len(bookings), "dry_run": True}
 
-    # Actually cancel the bookings
+    # Actually cancel the bookings, a few at a time (see CalComTool.bulk_cancel_user_bookings)
     cancelled = []
     failed = []
 
-    for booking in bookings:
-        try:
-            print(f"Cancelling booking: {booking['title']} (UID: {booking['uid']})")
-            response = calcom_client.cancel_a_booking(booking["uid"])
-
-            if response.get("status") == "success":
-                cancelled.append(
-                    {
-                        "uid": booking["uid"],
-                        "title": booking["title"],
-                        "response": response,
-                    }
-                )
-                print(f"  ✓ Successfully cancelled: {booking['title']}")
-            else:
-                failed.append(
-                    {
-                        "uid": booking["uid"],
-                        "title": booking["title"],
-                        "error": response.get("message", "Unknown error"),
-                        "response": response,
-                    }
-                )
-                print(
-                    f"  ✗ Failed to cancel: {booking['title']} - {response.get('message', 'Unknown error')}"
-                )
-
-        except Exception as e:
+    response = calcom_client.bulk_cancel_user_bookings(
+        attendee_email,
+        booking_uids={booking["uid"] for booking in bookings},
+        status=status,
+    )
+    data = response["result"]["data"]
+    items = data.get("items", []) if isinstance(data, dict) else []
+    if not items and response["status"] == "error":
+        print(f"  ✗ Bulk cancellation failed: {response['result']['message']}")
+    for item in items:
+        booking = item["item"]
+        if item["status"] == "success":
+            cancelled.append(
+                {"uid": booking["uid"], "title": booking["title"], "response": item}
+            )
+            print(f"  ✓ Successfully cancelled: {booking['title']}")
+        else:
             failed.append(
-                {"uid": booking["uid"], "title": booking["title"], "error": str(e)}
+                {
+                    "uid": booking["uid"],
+                    "title": booking["title"],
+                    "error": item["message"],
+                    "response": item,
+                }
             )
-            print(f"  ✗ Exception while cancelling: {booking['title']} - {str(e)}")
+            print(f"  ✗ Failed to cancel: {booking['title']} - {item['message']}")
 
     print(f"\nCancellation complete:")
     print(f"  Successfully cancelled: {len(cancelled)}")
@@ -148,7 +142,8 @@ if __name__ == "__main__":
     client = CalComTool(
         # # Wrong API key for testing
         # load API key from .env
-        api_key=os.getenv("CALCOM_API_KEY")
+        api_key=os.getenv("CALCOM_API_KEY"),
+        user_name=os.getenv("CALCOM_USERNAME"),
     )
     # response = client.get_my_profile()
 
@@ -0,0 +1,45 @@
+# Gunicorn settings for the backend, e.g. `gunicorn -c gunicorn.conf.py main:app`
+#
+# The app is imported and warmed up once in the master, then workers are forked
+# from it: they share the imported modules and clients copy-on-write and start
+# serving within milliseconds instead of each paying the startup cost.
+
+# System imports
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '3020')}"
+# Sessions are kept in process memory, so keep a single worker unless they move
+# to a shared store; requests are served concurrently by its threads
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+# Enough threads for the admitted chat turns, their queue (CHAT_ADMISSION_*)
+# and cheap endpoints such as /api/health
+threads = int(os.getenv("GUNICORN_THREADS", "32"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+preload_app = True
+
+
+def when_ready(server):
+    # main is already imported by preload_app
+    import main
+
+    main.warm_up()
+    # Move everything allocated so far out of the GC's reach, so collections in
+    # the workers don't write to (and un-share) the inherited pages
+    gc.collect()
+    gc.freeze()
+
+
+def post_worker_init(worker):
+    # Background threads (e.g. the Cal.com refresher) don't survive the fork
+    import main
+
+    main.start_background_tasks()
+
+
+def child_exit(server, worker):
+    # Drop the metrics files of dead workers (PROMETHEUS_MULTIPROC_DIR mode)
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,45 +1,357 @@
 # System imports
 import os, sys, json
+import hashlib
+import time
 import traceback
+import uuid
+
+# Logging imports
+from loguru import logger
 
 # Flask imports
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
 
 # Cal.com wrapper, utils imports
 from cal import CalComTool
-from tools.system import get_system_message
+from utils.admission import AdmissionController, AdmissionRejected
+from tools.intent import INTENT_ROUTER_ENABLED, IntentRouter
+from tools.model_router import ModelRouter
+from tools.refresher import CalComRefresher
+from tools.tenants import DEFAULT_TENANT, CalComToolPool, UnknownTenant
+from tools.system import (
+    get_system_message,
+    get_system_prompt,
+    get_system_prompt_version,
+)
+from utils.circuit import CircuitBreaker, CircuitOpenError
 from utils.datetime import get_current_server_time, get_current_server_time_in_iso
+from utils.deadline import (
+    DeadlineExceeded,
+    clear_deadline,
+    get_deadline,
+    parse_timeout_header,
+    remaining,
+    set_deadline,
+)
+from utils.idempotency import (
+    IdempotencyConflict,
+    IdempotencyInProgress,
+    IdempotencyStore,
+)
+from utils.lazy import Lazy
+from utils.log import configure_logging
+from utils.metrics import (
+    CALCOM_WEBHOOK_EVENTS,
+    CHAT_REQUEST_LATENCY,
+    LLM_COMPLETION_LATENCY,
+    TOOL_DISPATCH_LATENCY,
+    render_metrics,
+)
 from utils.print import to_serializable
+from utils.profiling import RequestProfiler, should_profile
+from utils.retry import RetryPolicy, parse_retry_after
+from utils.serialization import FastJSONProvider, compress_response
+from utils.tracing import finish_trace, span, start_trace
+from utils.webhooks import verify_signature
 
 # Environment variable imports
-from openai import OpenAI
 from dotenv import load_dotenv
 
 # Load the project-wise .env variables
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
 
+# Configure log level and sinks from the environment (see utils/log.py)
+configure_logging()
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = FastJSONProvider(app)  # orjson-backed jsonify / request.get_json
 CORS(app)  # @TODO: Add CORS constraints in the future
 
-# Initialize OpenAI client and tools at start
-# client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY_LIVEXAI"))
-cal_tool = CalComTool(api_key=os.getenv("CALCOM_API_KEY"))
-tool_dispatch = {
-    "cancel_user_booking": cal_tool.cancel_user_booking,
-    "create_a_cal_booking": cal_tool.create_a_cal_booking,
-    "list_all_cal_bookings": cal_tool.list_all_cal_bookings,
-}
-tool_specs = cal_tool.get_function_call_specs()
+
+# Budget of an /api/chat request; clients may ask for less with `X-Request-Timeout`
+CHAT_REQUEST_TIMEOUT = float(os.getenv("CHAT_REQUEST_TIMEOUT", "60"))
+
+# Per-attempt OpenAI timeouts (seconds); the read timeout is further capped by
+# whatever is left of the request's deadline
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "3.05"))
+OPENAI_READ_TIMEOUT = float(os.getenv("OPENAI_READ_TIMEOUT", "30"))
+OPENAI_WRITE_TIMEOUT = float(os.getenv("OPENAI_WRITE_TIMEOUT", "10"))
+OPENAI_POOL_TIMEOUT = float(os.getenv("OPENAI_POOL_TIMEOUT", "2"))
+# One pooled connection per concurrently admitted chat turn
+OPENAI_MAX_CONNECTIONS = int(
+    os.getenv("OPENAI_MAX_CONNECTIONS", os.getenv("CHAT_ADMISSION_MAX_CONCURRENT", "8"))
+)
+
+
+def _create_openai_client():
+    # The openai package alone takes most of the import time, so it is only
+    # loaded here (on first use, or by warm_up() before workers fork).
+    # httpx is the client the pinned openai versions are built on (requirements.txt)
+    import httpx
+    from openai import DefaultHttpxClient, OpenAI
+
+    # Retries are done by create_completion() under openai_retry_policy
+    # return OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    return OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY_LIVEXAI"),
+        timeout=_openai_timeout(OPENAI_READ_TIMEOUT),
+        max_retries=0,
+        http_client=DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+                keepalive_expiry=float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "30")),
+            )
+        ),
+    )
+
+
+def _openai_timeout(read_timeout):
+    from openai import Timeout
+
+    return Timeout(
+        connect=min(OPENAI_CONNECT_TIMEOUT, read_timeout),
+        read=read_timeout,
+        write=OPENAI_WRITE_TIMEOUT,
+        pool=OPENAI_POOL_TIMEOUT,
+    )
+
+
+# CalComTool methods the chat can call (see CalComTool.get_function_call_specs)
+TOOL_FUNCTIONS = (
+    "cancel_user_booking",
+    "create_a_cal_booking",
+    "list_all_cal_bookings",
+    "bulk_create_cal_bookings",
+    "bulk_cancel_user_bookings",
+)
+
+
+def _tool_dispatch(tool):
+    return {name: getattr(tool, name) for name in TOOL_FUNCTIONS}
+
+
+def _create_calcom_tool(tenant):
+    return CalComTool(
+        api_key=tenant.api_key,
+        user_name=tenant.user_name,
+        webhook_secret=tenant.webhook_secret,
+    )
+
+
+# Keeps Cal.com event types and near-term availability warm in the background
+CALCOM_REFRESH_ENABLED = os.getenv("CALCOM_REFRESH_ENABLED", "0") == "1"
+
+# OpenAI client, created on first use (see warm_up())
+client = Lazy(_create_openai_client)
+# One CalComTool per tenant (`X-Tenant-ID` header), created on first use
+calcom_pool = CalComToolPool.from_env(
+    _create_calcom_tool,
+    create_refresher=CalComRefresher.from_env if CALCOM_REFRESH_ENABLED else None,
+)
+tool_specs = Lazy(CalComTool.get_function_call_specs)
+
+# Answers simple commands (e.g. listing bookings) without an LLM round trip
+intent_router = IntentRouter()
+
+# Caps concurrent chat turns, queueing a bounded number of extra ones
+chat_admission = AdmissionController.from_env("chat", prefix="CHAT_ADMISSION_")
+
+# Completed chat responses by `Idempotency-Key`, replayed when a client retries
+chat_idempotency = IdempotencyStore(
+    "chat",
+    maxsize=int(os.getenv("CHAT_IDEMPOTENCY_MAX_ENTRIES", "1024")),
+    ttl=float(os.getenv("CHAT_IDEMPOTENCY_TTL", "86400")),
+)
+
+# Shared secret of the Cal.com webhooks of tenants without their own
+# (see /api/webhooks/calcom)
+CALCOM_WEBHOOK_SECRET = os.getenv("CALCOM_WEBHOOK_SECRET")
+
+# Picks the chat model for each turn (see MODEL_* environment variables)
+model_router = ModelRouter.from_env()
+
+# Fail fast instead of waiting on timeouts while OpenAI is degraded
+openai_breaker = CircuitBreaker.from_env("openai", prefix="OPENAI_CIRCUIT_")
+# Bounded, jittered retries of transient OpenAI failures
+openai_retry_policy = RetryPolicy.from_env(
+    "OPENAI_RETRY_", max_attempts=2, base_delay=0.5, max_delay=4.0, deadline=60.0
+)
+
+
+def openai_transient_errors():
+    """
+    OpenAI errors that are retried and count against the circuit breaker
+    """
+    import openai
+
+    return (
+        openai.APIConnectionError,  # includes openai.APITimeoutError
+        openai.InternalServerError,
+        openai.RateLimitError,
+    )
+
 
 # Store conversation sessions
 # @TODO: Change from in-program store to DB store (SQLite or Posgres)
 sessions = {}
+# System prompt version (hash) each session was started with
+session_prompt_versions = {}
+# Tenant each session belongs to
+session_tenants = {}
+# Sessions whose previous turn needed a model fallback: next turn goes to the large model
+session_model_escalations = set()
+
+
+def create_completion(messages, model):
+    """
+    Run one chat completion through the OpenAI circuit breaker and return the
+    first choice as a dict. Transient failures are retried under
+    openai_retry_policy, and no attempt outlives the request's deadline.
+    Raises CircuitOpenError while the circuit is open, DeadlineExceeded when
+    there is no time left for an attempt.
+    """
+    from openai import APITimeoutError
+
+    transient_errors = openai_transient_errors()
+    started_at = time.monotonic()
+    deadline_at = get_deadline()
+    # Checked before reserving a breaker slot, so a half-open probe is never
+    # spent on a call that can't be made
+    if openai_retry_policy.remaining(started_at, deadline_at) < 0.1:
+        raise DeadlineExceeded(f"No time left to call {model}")
+    openai_breaker.before_call()
+    attempt = 0
+
+    while True:
+        budget = openai_retry_policy.remaining(started_at, deadline_at)
+        if budget < 0.1:
+            # Every exit settles the reserved slot: after a transient failure
+            # the budget ran out on OpenAI's account, otherwise OpenAI wasn't called
+            if attempt:
+                openai_breaker.record_failure()
+            else:
+                openai_breaker.release()
+            raise DeadlineExceeded(f"No time left to call {model}")
+        try:
+            attempt_started_at = time.perf_counter()
+            with LLM_COMPLETION_LATENCY.labels(model).time(), span("llm"):
+                completion = client.get().chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    tools=tool_specs.get(),
+                    timeout=_openai_timeout(min(OPENAI_READ_TIMEOUT, budget)),
+                )
+            break
+        except transient_errors as e:
+            if (
+                isinstance(e, APITimeoutError)
+                and budget < OPENAI_READ_TIMEOUT
+                and openai_retry_policy.remaining(started_at, deadline_at) < 0.1
+            ):
+                # The timeout was cut to fit the deadline and used it up, so it
+                # says nothing about OpenAI (else any client could open the
+                # circuit with a tiny X-Request-Timeout); only an earlier
+                # attempt counts
+                if attempt:
+                    openai_breaker.record_failure()
+                else:
+                    openai_breaker.release()
+                raise
+            response = getattr(e, "response", None)
+            retry_after = parse_retry_after(
+                response.headers.get("Retry-After") if response is not None else None
+            )
+            delay = openai_retry_policy.next_delay(
+                attempt, started_at, retry_after, deadline_at
+            )
+            if delay is None:
+                openai_breaker.record_failure()
+                raise
+            logger.warning(
+                "{} completion attempt {} failed ({}), retrying in {:.2f}s",
+                model,
+                attempt + 1,
+                type(e).__name__,
+                delay,
+            )
+            time.sleep(delay)
+            attempt += 1
+        except Exception:
+            # Any other API error still means OpenAI is reachable
+            openai_breaker.record_success()
+            raise
+    openai_breaker.record_success()
+    intent_router.record_llm_latency(time.perf_counter() - attempt_started_at)
+    model_router.record_usage(model, getattr(completion, "usage", None))
+
+    # Process the response
+    return to_serializable(completion.choices[0])
+
+
+@app.before_request
+def begin_request_trace():
+    # Only actual chat turns; CORS preflights (OPTIONS) must never queue or be rejected
+    if request.endpoint == "chat" and request.method == "POST":
+        # Upstream calls made for this request share its deadline
+        set_deadline(
+            parse_timeout_header(
+                request.headers.get("X-Request-Timeout"),
+                default=CHAT_REQUEST_TIMEOUT,
+                maximum=CHAT_REQUEST_TIMEOUT,
+            )
+        )
+        start_trace(request.path)
+
+        # Wait for a chat slot (bounded by the queue timeout and the deadline),
+        # or fail fast so clients back off instead of piling onto the upstreams
+        try:
+            with span("admission_queue"):
+                chat_admission.acquire(timeout=remaining())
+        except AdmissionRejected as e:
+            response = jsonify(
+                {
+                    "error": str(e),
+                    "error_type": "AdmissionRejected",
+                    "reason": e.reason,
+                    "endpoint": "/api/chat",
+                }
+            )
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, 429
+        g.admitted_at = time.monotonic()
+
+        if should_profile(request.headers):
+            g.profiler = RequestProfiler(request.path)
+            g.profiler.start()
+
+
+@app.after_request
+def add_server_timing(response):
+    profiler = g.pop("profiler", None)
+    trace = finish_trace()
+    if profiler is not None:
+        profiler.stop()
+        profiler.save(trace.trace_id if trace else uuid.uuid4().hex)
+    if trace is not None:
+        response.headers["Server-Timing"] = trace.server_timing_header()
+        response.headers["X-Trace-Id"] = trace.trace_id
+        response.headers["Timing-Allow-Origin"] = "*"
+    return compress_response(response, request.headers.get("Accept-Encoding"))
+
+
+@app.teardown_request
+def end_request_deadline(_):
+    admitted_at = g.pop("admitted_at", None)
+    if admitted_at is not None:
+        chat_admission.release(time.monotonic() - admitted_at)
+    clear_deadline()
 
 
 @app.route("/api/chat", methods=["POST"])
+@CHAT_REQUEST_LATENCY.time()
 def chat():
     """
     Main chat endpoint that processes user messages and returns AI responses
@@ -48,6 +360,68 @@ def chat():
         "message": "user message",
         "session_id": "optional session identifier"
     }
+    The Cal.com host is chosen by the `X-Tenant-ID` header (default tenant
+    without it). With an `Idempotency-Key` header, a retried request gets the stored response
+    of the first one (marked `Idempotent-Replayed: true`) instead of running the
+    turn again; a duplicate sent while the first is still running waits for it.
+    """
+    idempotency_key = request.headers.get("Idempotency-Key")
+    if not idempotency_key:
+        return chat_turn()
+
+    try:
+        (body, status, headers), replayed = chat_idempotency.run(
+            (current_tenant_id(), idempotency_key),
+            lambda: _freeze_response(chat_turn()),
+            fingerprint=hashlib.sha256(request.get_data()).hexdigest(),
+            # Keep overload and server errors out, so a retry runs the turn again
+            should_store=lambda result: result[1] < 500 and result[1] != 429,
+            wait_timeout=remaining(),
+        )
+    except IdempotencyConflict:
+        # Stored keys include the tenant id: error messages name only the client's key
+        return (
+            jsonify(
+                {
+                    "error": f"Idempotency-Key '{idempotency_key}' was already used for a different request",
+                    "error_type": "IdempotencyConflict",
+                    "endpoint": "/api/chat",
+                }
+            ),
+            422,
+        )
+    except IdempotencyInProgress:
+        response = jsonify(
+            {
+                "error": f"Request with Idempotency-Key '{idempotency_key}' is still in progress",
+                "error_type": "IdempotencyInProgress",
+                "endpoint": "/api/chat",
+            }
+        )
+        response.headers["Retry-After"] = "1"
+        return response, 409
+
+    response = Response(body, status=status, headers=headers)
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return response
+
+
+def _freeze_response(rv):
+    """
+    (body, status, headers) of a view's return value, safe to share and replay
+    """
+    response = app.make_response(rv)
+    return response.get_data(), response.status_code, list(response.headers.items())
+
+
+def current_tenant_id():
+    return request.headers.get("X-Tenant-ID") or DEFAULT_TENANT
+
+
+def chat_turn():
+    """
+    Run one chat turn for the current request
     """
     try:
         data = request.get_json()
@@ -60,9 +434,40 @@ def chat():
             "session_id", "default"
         )  # Use "default" if no session ID provided
 
+        # The tenant's tool itself is only created once a tool is called
+        tenant_id = current_tenant_id()
+        try:
+            calcom_pool.tenant(tenant_id)
+        except UnknownTenant as e:
+            return (
+                jsonify(
+                    {
+                        "error": str(e),
+                        "error_type": "UnknownTenant",
+                        "endpoint": "/api/chat",
+                    }
+                ),
+                404,
+            )
+
         # Initialize session if it doesn't exist
         if session_id not in sessions:
-            sessions[session_id] = [get_system_message()]
+            # The prompt and the version reported for it come from one read,
+            # so a reload in between can't make them disagree
+            system_prompt, prompt_version = get_system_prompt()
+            sessions[session_id] = [get_system_message(system_prompt)]
+            session_prompt_versions[session_id] = prompt_version
+            session_tenants[session_id] = tenant_id
+        elif session_tenants.get(session_id, tenant_id) != tenant_id:
+            return (
+                jsonify(
+                    {
+                        "error": f"Session {session_id} belongs to another tenant",
+                        "endpoint": "/api/chat",
+                    }
+                ),
+                403,
+            )
 
         # Create a new message list for the session
         messages = sessions[session_id]
@@ -78,28 +483,74 @@ def chat():
         # Add user message to the session
         messages.append({"role": "user", "content": user_message})
 
-        # Create the OpenAI chat completion request
-        completion = client.chat.completions.create(
-            model="gpt-4.1",
-            messages=messages,
-            tools=tool_specs,
-        )
+        # Simple commands are routed straight to a tool, skipping the LLM
+        choice_dict = None
+        if INTENT_ROUTER_ENABLED:
+            with span("intent_router"):
+                choice_dict = intent_router.route(user_message)
+
+        if choice_dict is None:
+            # Pick the model for this turn, falling back to the large model
+            # when the small one produces malformed tool calls
+            model, _ = model_router.choose(
+                user_message,
+                messages,
+                escalate=session_id in session_model_escalations,
+            )
+            session_model_escalations.discard(session_id)
+            try:
+                choice_dict = create_completion(messages, model)
+                if model_router.needs_fallback(model, choice_dict, tool_specs.get()):
+                    logger.warning(
+                        "Malformed reply from {}, retrying on {}",
+                        model,
+                        model_router.large_model,
+                    )
+                    model_router.record_fallback(model)
+                    session_model_escalations.add(session_id)
+                    choice_dict = create_completion(messages, model_router.large_model)
+            except CircuitOpenError as e:
+                response = jsonify(
+                    {
+                        "error": str(e),
+                        "error_type": "CircuitOpenError",
+                        "endpoint": "/api/chat",
+                    }
+                )
+                response.headers["Retry-After"] = str(max(1, round(e.retry_in)))
+                return response, 503
+            except DeadlineExceeded as e:
+                return (
+                    jsonify(
+                        {
+                            "error": str(e),
+                            "error_type": "DeadlineExceeded",
+                            "endpoint": "/api/chat",
+                        }
+                    ),
+                    504,
+                )
 
-        # Process the response
-        choice_dict = to_serializable(completion.choices[0])
         tool_calls = choice_dict.get("message", {}).get("tool_calls", [])
 
         # Prepare the response data
-        response_data = {"message": "", "tool_results": [], "session_id": session_id}
+        response_data = {
+            "message": "",
+            "tool_results": [],
+            "session_id": session_id,
+            "prompt_version": session_prompt_versions.get(session_id),
+        }
 
         if tool_calls:
             # If there are tool calls, execute them
+            dispatch = _tool_dispatch(calcom_pool.get(tenant_id))
             for call in tool_calls:
                 func_name = call["function"]["name"]
                 args = json.loads(call["function"]["arguments"])
 
-                if func_name in tool_dispatch:
-                    result = tool_dispatch[func_name](**args)
+                if func_name in dispatch:
+                    with TOOL_DISPATCH_LATENCY.labels(func_name).time():
+                        result = dispatch[func_name](**args)
                     response_data["tool_results"].append(
                         {"tool": func_name, "args": args, "result": result}
                     )
@@ -156,11 +607,57 @@ def chat():
         return jsonify(error_details), 500
 
 
+@app.route("/api/webhooks/calcom", methods=["POST"])
+@app.route("/api/webhooks/calcom/<tenant_id>", methods=["POST"])
+def calcom_webhook(tenant_id=DEFAULT_TENANT):
+    """
+    Cal.com webhook receiver: booking created / cancelled / rescheduled events
+    invalidate the cached bookings and availability they affect. Deliveries
+    must be signed (`X-Cal-Signature-256`) with the tenant's webhook secret,
+    CALCOM_WEBHOOK_SECRET by default.
+    """
+    try:
+        secret = calcom_pool.tenant(tenant_id).webhook_secret or CALCOM_WEBHOOK_SECRET
+    except UnknownTenant as e:
+        return jsonify({"error": str(e)}), 404
+    if not secret:
+        return jsonify({"error": "Cal.com webhook is not configured"}), 404
+
+    body = request.get_data()
+    if not verify_signature(secret, body, request.headers.get("X-Cal-Signature-256")):
+        CALCOM_WEBHOOK_EVENTS.labels("unknown", "rejected").inc()
+        logger.warning("Rejected Cal.com webhook with an invalid signature")
+        return jsonify({"error": "Invalid signature"}), 401
+
+    try:
+        event = json.loads(body)
+    except ValueError:
+        CALCOM_WEBHOOK_EVENTS.labels("unknown", "rejected").inc()
+        return jsonify({"error": "Invalid JSON payload"}), 400
+    if not isinstance(event, dict):
+        CALCOM_WEBHOOK_EVENTS.labels("unknown", "rejected").inc()
+        return jsonify({"error": "Invalid JSON payload"}), 400
+
+    trigger = str(event.get("triggerEvent"))
+    # Nothing is cached before the tenant's tool is first used
+    tool = calcom_pool.peek(tenant_id)
+    summary = tool.apply_webhook_event(event) if tool is not None else None
+    if summary is None:
+        CALCOM_WEBHOOK_EVENTS.labels(trigger, "ignored").inc()
+        return jsonify({"status": "ignored", "trigger": trigger})
+
+    CALCOM_WEBHOOK_EVENTS.labels(trigger, "applied").inc()
+    return jsonify({"status": "applied", **summary})
+
+
 @app.route("/api/sessions/<session_id>", methods=["DELETE"])
 def clear_session(session_id):
     """Clear a specific conversation session"""
     if session_id in sessions:
         del sessions[session_id]
+        session_prompt_versions.pop(session_id, None)
+        session_tenants.pop(session_id, None)
+        session_model_escalations.discard(session_id)
         return jsonify({"message": f"Session {session_id} cleared"})
     return jsonify({"message": "Session not found"}), 404
 
@@ -174,9 +671,68 @@ def list_sessions():
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "timestamp": get_current_server_time_in_iso()})
+    return jsonify(
+        {
+            "status": "healthy",
+            "timestamp": get_current_server_time_in_iso(),
+            "calcom": {
+                "pool": calcom_pool.stats(),
+                "tenants": {
+                    tenant_id: tool.get_transport_stats()
+                    for tenant_id, tool in calcom_pool.items()
+                },
+            },
+            "openai": {"circuit_breaker": openai_breaker.stats()},
+            "intent_router": intent_router.stats(),
+            "model_router": model_router.stats(),
+            "chat_admission": chat_admission.stats(),
+            "chat_idempotency": chat_idempotency.stats(),
+        }
+    )
+
+
+@app.route("/api/metrics", methods=["GET"])
+def metrics():
+    """Prometheus metrics endpoint"""
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
+
+
+def warm_up():
+    """
+    Do the one-off startup work ahead of the first request: import the heavy
+    modules, build the clients (validating the default tenant's Cal.com key) and
+    load the system prompt. Under gunicorn this runs once in the master before
+    workers are forked (see gunicorn.conf.py), so workers share these pages
+    copy-on-write. Pooled connections are closed again, so nothing
+    socket-related crosses the fork.
+    """
+    started_at = time.perf_counter()
+    # Resources of the OpenAI client are imported on first attribute access
+    client.get().chat.completions
+    if DEFAULT_TENANT in calcom_pool.tenants:
+        calcom_pool.get(DEFAULT_TENANT)
+        # Sockets must not be shared with the forked workers
+        calcom_pool.close_connections()
+    tool_specs.get()
+    get_system_prompt_version()
+    get_current_server_time()
+    logger.info(
+        "Warm-up finished in {:.0f} ms", (time.perf_counter() - started_at) * 1000
+    )
+
+
+def start_background_tasks():
+    """
+    Start the per-process background threads. Under gunicorn this runs in each
+    worker after the fork (see gunicorn.conf.py), as threads started in the
+    master would not be carried over.
+    """
+    calcom_pool.start_background_tasks()
 
 
 if __name__ == "__main__":
     print("Starting Flask server for personal schedule booking system...")
+    warm_up()
+    start_background_tasks()
     app.run(debug=True, host="0.0.0.0", port=3020)
@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from cal import CalComTool
+from utils.circuit import CLOSED, OPEN
+from utils.deadline import clear_deadline, set_deadline
+
+
+def timing_out_transport(method, url, timeout, **kwargs):
+    # Cal.com never answers: every read runs into its timeout
+    time.sleep(timeout[1])
+    raise requests.exceptions.ReadTimeout(f"Read timed out ({url})")
+
+
+def offline_tool():
+    tool = CalComTool(
+        api_key="offline",
+        user_name="offline",
+        validate_api_key=False,
+        transport=timing_out_transport,
+    )
+    tool.read_timeout = 0.2
+    tool.rate_limiter.rate = 0  # no pacing
+    tool._get_circuit_breaker("me").failure_threshold = 1
+    return tool
+
+
+def test_short_deadlines_cannot_trip_breaker():
+    tool = offline_tool()
+    try:
+        for _ in range(3):
+            set_deadline(0.1)
+            assert tool.get_my_profile()["status"] == "error"
+            clear_deadline()
+    finally:
+        clear_deadline()
+
+    assert tool._get_circuit_breaker("me").state == CLOSED
+
+
+def test_upstream_timeouts_trip_breaker():
+    tool = offline_tool()
+    tool.retry_policy.max_attempts = 1
+    assert tool.get_my_profile()["status"] == "error"
+    assert tool._get_circuit_breaker("me").state == OPEN
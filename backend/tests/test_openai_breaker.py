@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+
+import pytest
+from openai import APITimeoutError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import main
+from utils.circuit import CLOSED, HALF_OPEN, CircuitBreaker
+from utils.deadline import DeadlineExceeded, clear_deadline, set_deadline
+
+
+class UnreachableClient:
+    def get(self):
+        raise AssertionError("OpenAI must not be called without time left")
+
+
+@pytest.fixture
+def half_open_breaker(monkeypatch):
+    # With no reset timeout, one failure leaves the circuit half-open right away
+    breaker = CircuitBreaker("openai", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == HALF_OPEN
+    monkeypatch.setattr(main, "openai_breaker", breaker)
+    monkeypatch.setattr(main, "client", UnreachableClient())
+    yield breaker
+    clear_deadline()
+
+
+def test_deadline_exhausted_keeps_half_open_probe(half_open_breaker):
+    set_deadline(0.01)
+    for _ in range(3):
+        with pytest.raises(DeadlineExceeded):
+            main.create_completion([], "gpt-4o-mini")
+
+    # The probe slot is still free for the next call that has time to make it
+    assert half_open_breaker.state == HALF_OPEN
+    half_open_breaker.before_call()
+    assert half_open_breaker.stats()["rejected"] == 0
+
+
+def test_release_frees_half_open_probe(half_open_breaker):
+    half_open_breaker.before_call()
+    half_open_breaker.release()
+    half_open_breaker.before_call()
+    assert half_open_breaker.state == HALF_OPEN
+    assert half_open_breaker.stats()["rejected"] == 0
+
+
+class DeadlineTimeout(APITimeoutError):
+    def __init__(self):
+        Exception.__init__(self, "Request timed out.")
+
+
+class TimingOutClient:
+    """
+    OpenAI client whose completions time out once their read timeout is spent
+    """
+
+    def get(self):
+        return self
+
+    @property
+    def chat(self):
+        return self
+
+    @property
+    def completions(self):
+        return self
+
+    def create(self, timeout, **kwargs):
+        time.sleep(timeout.read)
+        raise DeadlineTimeout()
+
+
+def test_short_deadlines_cannot_trip_breaker(monkeypatch):
+    breaker = CircuitBreaker("openai", failure_threshold=1)
+    monkeypatch.setattr(main, "openai_breaker", breaker)
+    monkeypatch.setattr(main, "client", TimingOutClient())
+    try:
+        for _ in range(3):
+            set_deadline(0.2)
+            with pytest.raises(APITimeoutError):
+                main.create_completion([], "gpt-4o-mini")
+            clear_deadline()
+    finally:
+        clear_deadline()
+
+    assert breaker.state == CLOSED
+    assert breaker.stats()["consecutive_failures"] == 0
@@ -0,0 +1,108 @@
+import json
+import os
+import re
+import threading
+import uuid
+
+from utils.metrics import INTENT_ROUTER_DECISIONS, INTENT_ROUTER_SECONDS_SAVED
+
+# Route simple, unambiguous requests to a tool without asking the LLM
+INTENT_ROUTER_ENABLED = os.getenv("INTENT_ROUTER_ENABLED", "1") == "1"
+
+EMAIL_PATTERN = r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"
+
+# e.g. "list my bookings for a@b.com", "Please show me all upcoming meetings of a@b.com"
+LIST_BOOKINGS_PATTERN = re.compile(
+    r"^(?:please\s+)?(?:(?:can|could)\s+you\s+)?(?:list|show)(?:\s+me)?(?:\s+all)?"
+    r"(?:\s+(?:of\s+)?my)?(?:\s+upcoming)?\s+(?:bookings|meetings|appointments)"
+    rf"\s+(?:for|of)\s+(?P<email>{EMAIL_PATTERN})(?:\s+please)?$",
+    re.IGNORECASE,
+)
+
+
+class IntentRouter:
+    """
+    Deterministic, pre-LLM recognizer for simple commands.
+    Only whole-message matches of a few fixed phrasings are routed, anything
+    else (or anything ambiguous) is left to the LLM. A routed message yields a
+    choice shaped like `to_serializable(completion.choices[0])`, so the rest
+    of the chat flow (tool dispatch, session history) is the same either way.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Running mean of the LLM round trips, i.e. what each hit saves
+        self.llm_latency_mean = None
+        self.llm_latency_samples = 0
+        self.seconds_saved = 0.0
+
+    def route(self, user_message):
+        """
+        Return a choice dict with the tool call for `user_message`, or None
+        """
+        message = " ".join(user_message.split()).rstrip(".!")
+        match = LIST_BOOKINGS_PATTERN.match(message)
+        if match is None:
+            INTENT_ROUTER_DECISIONS.labels("miss").inc()
+            with self._lock:
+                self.misses += 1
+            return None
+
+        INTENT_ROUTER_DECISIONS.labels("hit").inc()
+        with self._lock:
+            self.hits += 1
+            if self.llm_latency_mean is not None:
+                self.seconds_saved += self.llm_latency_mean
+                INTENT_ROUTER_SECONDS_SAVED.inc(self.llm_latency_mean)
+        return self._tool_call_choice(
+            "list_all_cal_bookings", {"user_email": match.group("email")}
+        )
+
+    def record_llm_latency(self, seconds):
+        with self._lock:
+            self.llm_latency_samples += 1
+            if self.llm_latency_mean is None:
+                self.llm_latency_mean = seconds
+            else:
+                self.llm_latency_mean += (
+                    seconds - self.llm_latency_mean
+                ) / self.llm_latency_samples
+
+    @staticmethod
+    def _tool_call_choice(name, arguments):
+        return {
+            "finish_reason": "tool_calls",
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"route_{uuid.uuid4().hex[:24]}",
+                        "type": "function",
+                        "function": {
+                            "name": name,
+                            "arguments": json.dumps(arguments),
+                        },
+                    }
+                ],
+            },
+        }
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": INTENT_ROUTER_ENABLED,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+                "mean_llm_latency_seconds": (
+                    round(self.llm_latency_mean, 4)
+                    if self.llm_latency_mean is not None
+                    else None
+                ),
+                "estimated_seconds_saved": round(self.seconds_saved, 3),
+            }
@@ -0,0 +1,142 @@
+import json
+import os
+import re
+import threading
+
+from utils.metrics import LLM_TOKENS, MODEL_FALLBACKS, MODEL_ROUTING_DECISIONS
+
+# Acknowledgements and confirmations, e.g. "yes please", "ok, that works", "thanks!"
+ACKNOWLEDGEMENT_PATTERN = re.compile(
+    r"^(?:(?:yes|yeah|yep|ok|okay|sure|great|perfect|thanks|thank you|cool|"
+    r"no|nope|sounds good|that works|go ahead|do it|confirm)[\s,.!]*)+"
+    r"(?:please)?[\s.!]*$",
+    re.IGNORECASE,
+)
+# Words and formats suggesting the turn needs the calendar tools
+TOOL_HINT_PATTERN = re.compile(
+    r"book|schedul|cancel|list|slot|meeting|appointment|calendar|event|available|"
+    r"@|\d{1,2}(?::\d{2})?\s*(?:am|pm)\b|\d{4}-\d{2}-\d{2}|\d{1,2}:\d{2}|"
+    r"today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday",
+    re.IGNORECASE,
+)
+
+
+class ModelRouter:
+    """
+    Pick the chat model for each turn
+    - the large model for long histories, turns likely to call tools, and the
+      turn after one that needed a fallback
+    - the small model for acknowledgements, confirmations and short chit-chat
+    A small-model reply with malformed tool calls (unknown tool, unparsable or
+    incomplete arguments) or no content at all is retried on the large model.
+    """
+
+    def __init__(
+        self,
+        large_model="gpt-4.1",
+        small_model="gpt-4.1-mini",
+        enabled=True,
+        small_max_words=8,
+        small_max_history=20,
+    ):
+        self.large_model = large_model
+        self.small_model = small_model
+        self.enabled = enabled and small_model != large_model
+        self.small_max_words = small_max_words
+        self.small_max_history = small_max_history
+        self._lock = threading.Lock()
+        self.decisions = {}  # (model, reason) -> count
+        self.fallbacks = 0
+
+    @classmethod
+    def from_env(cls, prefix="MODEL_"):
+        return cls(
+            large_model=os.getenv(f"{prefix}LARGE", "gpt-4.1"),
+            small_model=os.getenv(f"{prefix}SMALL", "gpt-4.1-mini"),
+            enabled=os.getenv(f"{prefix}ROUTING_ENABLED", "1") == "1",
+            small_max_words=int(os.getenv(f"{prefix}SMALL_MAX_WORDS", "8")),
+            small_max_history=int(os.getenv(f"{prefix}SMALL_MAX_HISTORY", "20")),
+        )
+
+    def choose(self, user_message, messages, escalate=False):
+        """
+        Return (model, reason) for a turn; `messages` is the session history
+        """
+        if not self.enabled:
+            return self._decide(self.large_model, "routing_disabled")
+        if escalate:
+            return self._decide(self.large_model, "previous_turn_fallback")
+        if len(messages) > self.small_max_history:
+            return self._decide(self.large_model, "long_history")
+        if ACKNOWLEDGEMENT_PATTERN.match(user_message.strip()):
+            return self._decide(self.small_model, "acknowledgement")
+        if TOOL_HINT_PATTERN.search(user_message):
+            return self._decide(self.large_model, "tools_likely")
+        if len(user_message.split()) <= self.small_max_words:
+            return self._decide(self.small_model, "short_message")
+        return self._decide(self.large_model, "default")
+
+    def _decide(self, model, reason):
+        MODEL_ROUTING_DECISIONS.labels(model, reason).inc()
+        with self._lock:
+            self.decisions[(model, reason)] = self.decisions.get((model, reason), 0) + 1
+        return model, reason
+
+    def needs_fallback(self, model, choice_dict, tool_specs):
+        """
+        Whether a reply from `model` should be retried on the large model
+        """
+        if model == self.large_model:
+            return False
+        message = choice_dict.get("message") or {}
+        tool_calls = message.get("tool_calls") or []
+        if not tool_calls:
+            return not message.get("content")
+
+        specs = {spec["function"]["name"]: spec["function"] for spec in tool_specs}
+        for call in tool_calls:
+            spec = specs.get(call.get("function", {}).get("name"))
+            if spec is None:
+                return True
+            try:
+                args = json.loads(call["function"].get("arguments") or "")
+            except ValueError:
+                return True
+            if not isinstance(args, dict):
+                return True
+            parameters = spec.get("parameters", {})
+            if any(name not in args for name in parameters.get("required", [])):
+                return True
+            if parameters.get("additionalProperties") is False and any(
+                name not in parameters.get("properties", {}) for name in args
+            ):
+                return True
+        return False
+
+    def record_fallback(self, model):
+        MODEL_FALLBACKS.labels(model, self.large_model).inc()
+        with self._lock:
+            self.fallbacks += 1
+
+    @staticmethod
+    def record_usage(model, usage):
+        """
+        Count the prompt/completion tokens of a completion's `usage`
+        """
+        if usage is None:
+            return
+        LLM_TOKENS.labels(model, "prompt").inc(usage.prompt_tokens or 0)
+        LLM_TOKENS.labels(model, "completion").inc(usage.completion_tokens or 0)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "large_model": self.large_model,
+                "small_model": self.small_model,
+                "decisions": {
+                    f"{model}:{reason}": count
+                    for (model, reason), count in self.decisions.items()
+                },
+                "fallbacks": self.fallbacks,
+            }
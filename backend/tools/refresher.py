@@ -0,0 +1,159 @@
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+
+from utils.datetime import get_day_range_utc
+from utils.metrics import CALCOM_REFRESH_REQUESTS
+
+
+class CalComRefresher:
+    """
+    Background thread keeping CalComTool's read cache warm, so interactive
+    requests rarely pay for a cold Cal.com call. Every `interval` seconds
+    (jittered by +/- `jitter`, so workers and restarts don't line up) it
+    refreshes the event type list and the same-day slots of the next `days`
+    days for the `event_types` most booked event types. These are the same
+    requests (and cache keys) as a booking's own lookups.
+    Refreshes only spend spare rate-limit budget: a cycle stops early once
+    fewer than `reserve` tokens would be left for interactive requests.
+    """
+
+    def __init__(
+        self, tool, interval=60.0, jitter=0.2, days=3, event_types=3, reserve=10.0
+    ):
+        self.tool = tool
+        self.interval = interval
+        self.jitter = jitter
+        self.days = days
+        self.event_types = event_types
+        self.reserve = reserve
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.cycles = 0
+        self.outcomes = {"refreshed": 0, "failed": 0, "skipped": 0}
+        self.last_cycle_seconds = None
+
+    @classmethod
+    def from_env(cls, tool, prefix="CALCOM_REFRESH_"):
+        return cls(
+            tool,
+            interval=float(os.getenv(f"{prefix}INTERVAL", "60")),
+            jitter=float(os.getenv(f"{prefix}JITTER", "0.2")),
+            days=int(os.getenv(f"{prefix}DAYS", "3")),
+            event_types=int(os.getenv(f"{prefix}EVENT_TYPES", "3")),
+            reserve=float(os.getenv(f"{prefix}RATE_LIMIT_RESERVE", "10")),
+        )
+
+    def start(self):
+        """
+        Start the refresh thread (once per process: threads don't survive a fork)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="calcom-refresher", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Cal.com refresher started: every {:.0f}s, {} day(s) of {} event type(s)",
+            self.interval,
+            self.days,
+            self.event_types,
+        )
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        # The first cycle runs right away, warming the caches of a fresh worker
+        while not self._stop.is_set():
+            try:
+                self.refresh_once()
+            except Exception as e:
+                logger.exception("Cal.com refresh cycle failed: {}", e)
+            delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._stop.wait(max(1.0, delay))
+
+    def refresh_once(self):
+        """
+        Run one refresh cycle and return the number of requests it made
+        """
+        started_at = time.monotonic()
+        requests_made = 0
+
+        if self._has_budget("event_types"):
+            requests_made += 1
+            self._record("event_types", self.tool.get_all_event_types(refresh=True))
+
+        today = datetime.now(timezone.utc)
+        day_ranges = [
+            get_day_range_utc((today + timedelta(days=day)).isoformat())
+            for day in range(self.days)
+        ]
+        for event_type_id in self.tool.most_booked_event_type_ids(self.event_types):
+            for day_range in day_ranges:
+                if self._stop.is_set() or not self._has_budget("slots"):
+                    break
+                requests_made += 1
+                self._record(
+                    "slots",
+                    self.tool.get_available_time_slots(
+                        event_type_id,
+                        day_range["start"],
+                        day_range["end"],
+                        refresh=True,
+                    ),
+                )
+            else:
+                continue
+            break  # out of budget (or stopping), the rest waits for the next cycle
+
+        with self._lock:
+            self.cycles += 1
+            self.last_cycle_seconds = time.monotonic() - started_at
+        logger.debug(
+            "Cal.com refresh cycle made {} request(s) in {:.2f}s",
+            requests_made,
+            self.last_cycle_seconds,
+        )
+        return requests_made
+
+    def _has_budget(self, kind):
+        # Leave at least `reserve` tokens (at most half the burst) for
+        # interactive requests
+        limiter = self.tool.rate_limiter
+        if limiter.available() - 1 >= min(self.reserve, limiter.burst / 2):
+            return True
+        self._count(kind, "skipped")
+        return False
+
+    def _record(self, kind, response):
+        self._count(kind, "failed" if "error" in response else "refreshed")
+
+    def _count(self, kind, outcome):
+        CALCOM_REFRESH_REQUESTS.labels(kind, outcome).inc()
+        with self._lock:
+            self.outcomes[outcome] += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "interval": self.interval,
+                "cycles": self.cycles,
+                "last_cycle_seconds": (
+                    round(self.last_cycle_seconds, 3)
+                    if self.last_cycle_seconds is not None
+                    else None
+                ),
+                **self.outcomes,
+            }
@@ -1,26 +1,109 @@
 import datetime
+import hashlib
+import threading
+import time
 import tzlocal
 import os
 
+from loguru import logger
 
-def get_system_message():
-    now = datetime.datetime.now(tzlocal.get_localzone())
-    now_str = now.strftime("%Y-%m-%d %H:%M:%S %Z%z")
+# Path to the system prompt text file
+PROMPT_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "system_prompt.txt"
+)
 
-    # Read the system prompt from the text file
-    prompt_file_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), "system_prompt.txt"
-    )
-    try:
-        # Read the system prompt from the file
-        with open(prompt_file_path, "r", encoding="utf-8") as f:
-            system_prompt = f.read().strip()
-    except FileNotFoundError:
-        # Fallback prompt if file is not found
-        system_prompt = """
+# Fallback prompt if file is not found
+FALLBACK_SYSTEM_PROMPT = """
         You are a specialized scheduling assistant that helps with calendar management and booking appointments.
         """
 
+# Minimum number of seconds between two mtime checks of the prompt file
+PROMPT_CHECK_INTERVAL = float(os.getenv("SYSTEM_PROMPT_CHECK_INTERVAL", "2.0"))
+
+# In-memory cache of the system prompt, shared across request threads
+_prompt_cache = {
+    "mtime": None,  # mtime of the file when it was last read, None if missing
+    "checked_at": 0.0,  # monotonic time of the last mtime check
+    "prompt": None,
+    "version": None,
+}
+_prompt_lock = threading.Lock()
+
+
+def _prompt_version(prompt):
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+
+
+def _load_system_prompt():
+    """
+    Return the cached (prompt, version), re-reading the prompt file only when its mtime changes
+    """
+    with _prompt_lock:
+        now = time.monotonic()
+        if (
+            _prompt_cache["prompt"] is not None
+            and now - _prompt_cache["checked_at"] < PROMPT_CHECK_INTERVAL
+        ):
+            return _prompt_cache["prompt"], _prompt_cache["version"]
+
+        _prompt_cache["checked_at"] = now
+        try:
+            mtime = os.stat(PROMPT_FILE_PATH).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if _prompt_cache["prompt"] is not None and mtime == _prompt_cache["mtime"]:
+            return _prompt_cache["prompt"], _prompt_cache["version"]
+
+        try:
+            # Read the system prompt from the file
+            with open(PROMPT_FILE_PATH, "r", encoding="utf-8") as f:
+                system_prompt = f.read().strip()
+        except FileNotFoundError:
+            logger.warning(
+                "System prompt file not found at {}, using fallback prompt",
+                PROMPT_FILE_PATH,
+            )
+            system_prompt = FALLBACK_SYSTEM_PROMPT
+            mtime = None
+
+        version = _prompt_version(system_prompt)
+        if _prompt_cache["version"] is not None and version != _prompt_cache["version"]:
+            logger.info(
+                "System prompt reloaded: {} -> {}", _prompt_cache["version"], version
+            )
+
+        _prompt_cache.update(mtime=mtime, prompt=system_prompt, version=version)
+        return system_prompt, version
+
+
+def get_system_prompt():
+    """
+    The system prompt currently in use and its version (short hash), taken from
+    one cached read so that they always belong together
+    """
+    return _load_system_prompt()
+
+
+def get_system_prompt_version():
+    """
+    Short hash identifying the system prompt currently in use
+    """
+    return _load_system_prompt()[1]
+
+
+def get_system_message(system_prompt=None):
+    """
+    System message for a new session, built from `system_prompt` (as returned
+    by `get_system_prompt`) or else the prompt currently in use
+    """
+    now = datetime.datetime.now(tzlocal.get_localzone())
+    now_str = now.strftime("%Y-%m-%d %H:%M:%S %Z%z")
+
+    if system_prompt is None:
+        # Read the system prompt from the in-memory cache
+        system_prompt, _ = _load_system_prompt()
+
     content = f"{system_prompt}\n\nThe current date and time is {now_str}."
 
     return {
@@ -0,0 +1,192 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from loguru import logger
+
+from utils.concurrency import SingleFlight
+
+# Tenant used by requests that don't name one (`X-Tenant-ID`)
+DEFAULT_TENANT = os.getenv("CALCOM_DEFAULT_TENANT", "default")
+
+
+class UnknownTenant(KeyError):
+    """
+    Raised for a tenant id that is not configured
+    """
+
+    def __init__(self, tenant_id):
+        self.tenant_id = tenant_id
+        super().__init__(f"Unknown tenant '{tenant_id}'")
+
+    def __str__(self):
+        return self.args[0]
+
+
+class Tenant:
+    """
+    One Cal.com host: the API key to act with and the calendar (username) to book
+    """
+
+    def __init__(self, tenant_id, api_key, user_name=None, webhook_secret=None):
+        self.tenant_id = tenant_id
+        self.api_key = api_key
+        self.user_name = user_name
+        self.webhook_secret = webhook_secret
+
+    def __repr__(self):
+        # Never print the API key
+        return f"Tenant({self.tenant_id!r}, user_name={self.user_name!r})"
+
+
+def tenants_from_env():
+    """
+    Configured tenants by id
+    - CALCOM_TENANTS_FILE: JSON object mapping tenant ids to
+      {"api_key": ..., "username": ..., "webhook_secret": ...}
+      (username and webhook_secret are optional)
+    - CALCOM_API_KEY (with the optional CALCOM_USERNAME and CALCOM_WEBHOOK_SECRET)
+      adds the default tenant, unless the file already defines it
+    """
+    tenants = {}
+    path = os.getenv("CALCOM_TENANTS_FILE")
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for tenant_id, config in json.load(f).items():
+                tenants[tenant_id] = Tenant(
+                    tenant_id,
+                    api_key=config["api_key"],
+                    user_name=config.get("username"),
+                    webhook_secret=config.get("webhook_secret"),
+                )
+
+    api_key = os.getenv("CALCOM_API_KEY")
+    if api_key and DEFAULT_TENANT not in tenants:
+        tenants[DEFAULT_TENANT] = Tenant(
+            DEFAULT_TENANT,
+            api_key=api_key,
+            user_name=os.getenv("CALCOM_USERNAME"),
+            webhook_secret=os.getenv("CALCOM_WEBHOOK_SECRET"),
+        )
+    return tenants
+
+
+class CalComToolPool:
+    """
+    One CalComTool per tenant, created on first use
+    - at most `maxsize` tools are kept; the least recently used one is evicted
+      (its connections closed and its background refresher stopped)
+    - concurrent first requests of a tenant share a single creation
+    Each tool has its own connections, rate limiter and caches, so tenants
+    don't interfere with each other. A request still holding an evicted tool
+    finishes with it normally.
+    """
+
+    def __init__(self, tenants, create_tool, maxsize=32, create_refresher=None):
+        self.tenants = tenants
+        self.create_tool = create_tool  # Tenant -> CalComTool
+        self.create_refresher = create_refresher  # CalComTool -> refresher, or None
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        self._tools = OrderedDict()  # tenant id -> CalComTool, most recent last
+        self._refreshers = {}  # tenant id -> refresher of the pooled tool
+        self._creations = SingleFlight()
+        self._background = False  # whether refreshers run in this process
+        self.created = 0
+        self.evicted = 0
+
+    @classmethod
+    def from_env(cls, create_tool, create_refresher=None):
+        return cls(
+            tenants_from_env(),
+            create_tool,
+            maxsize=int(os.getenv("CALCOM_TENANT_POOL_SIZE", "32")),
+            create_refresher=create_refresher,
+        )
+
+    def tenant(self, tenant_id):
+        tenant = self.tenants.get(tenant_id)
+        if tenant is None:
+            raise UnknownTenant(tenant_id)
+        return tenant
+
+    def get(self, tenant_id):
+        """
+        The tenant's tool, created (and its API key validated) if not pooled
+        """
+        with self._lock:
+            tool = self._tools.get(tenant_id)
+            if tool is not None:
+                self._tools.move_to_end(tenant_id)
+                return tool
+        tenant = self.tenant(tenant_id)
+        return self._creations.do(tenant_id, lambda: self._create(tenant))
+
+    def peek(self, tenant_id):
+        """
+        The tenant's pooled tool without creating it or touching the LRU order
+        """
+        with self._lock:
+            return self._tools.get(tenant_id)
+
+    def _create(self, tenant):
+        tool = self.create_tool(tenant)
+        refresher = self.create_refresher(tool) if self.create_refresher else None
+        with self._lock:
+            self._tools[tenant.tenant_id] = tool
+            self.created += 1
+            if refresher is not None:
+                self._refreshers[tenant.tenant_id] = refresher
+                if self._background:
+                    refresher.start()
+            evicted = []
+            while len(self._tools) > self.maxsize:
+                evicted_id, evicted_tool = self._tools.popitem(last=False)
+                evicted.append(
+                    (evicted_id, evicted_tool, self._refreshers.pop(evicted_id, None))
+                )
+                self.evicted += 1
+
+        for evicted_id, evicted_tool, evicted_refresher in evicted:
+            logger.info("Evicting Cal.com tool of tenant {}", evicted_id)
+            if evicted_refresher is not None:
+                evicted_refresher.stop()
+            evicted_tool.close_connections()
+        return tool
+
+    def items(self):
+        """
+        (tenant id, tool) pairs of the pooled tools
+        """
+        with self._lock:
+            return list(self._tools.items())
+
+    def start_background_tasks(self):
+        """
+        Run the refreshers of pooled and future tools in this process
+        """
+        with self._lock:
+            self._background = True
+            refreshers = list(self._refreshers.values())
+        for refresher in refreshers:
+            refresher.start()
+
+    def close_connections(self):
+        for _, tool in self.items():
+            tool.close_connections()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "tenants": len(self.tenants),
+                "pooled": len(self._tools),
+                "maxsize": self.maxsize,
+                "created": self.created,
+                "evicted": self.evicted,
+                "refreshers": {
+                    tenant_id: refresher.stats()
+                    for tenant_id, refresher in self._refreshers.items()
+                },
+            }
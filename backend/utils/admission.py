@@ -0,0 +1,134 @@
+import math
+import os
+import threading
+import time
+from collections import deque
+
+from utils.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_QUEUE_WAIT,
+    ADMISSION_REJECTIONS,
+)
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a request is not admitted; `retry_after` is a hint in seconds
+    """
+
+    def __init__(self, name, reason, retry_after):
+        self.name = name
+        self.reason = reason  # "queue_full" or "queue_timeout"
+        self.retry_after = retry_after
+        super().__init__(f"{name} is overloaded ({reason}), retry in {retry_after}s")
+
+
+class AdmissionController:
+    """
+    Cap on concurrent requests with a bounded FIFO wait queue
+    - up to `max_concurrent` requests run at once
+    - up to `max_queue` more wait, each for at most `queue_timeout` seconds
+    - anything beyond that is rejected right away
+    A finishing request hands its slot directly to the oldest waiter.
+    """
+
+    def __init__(self, name, max_concurrent=8, max_queue=16, queue_timeout=5.0):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters = deque()  # threading.Event per queued request, oldest first
+        self._service_time = None  # moving average of admitted request durations
+        self.admitted = 0
+        self.rejected = {"queue_full": 0, "queue_timeout": 0}
+
+    @classmethod
+    def from_env(cls, name, prefix):
+        return cls(
+            name,
+            max_concurrent=int(os.getenv(f"{prefix}MAX_CONCURRENT", "8")),
+            max_queue=int(os.getenv(f"{prefix}MAX_QUEUE", "16")),
+            queue_timeout=float(os.getenv(f"{prefix}QUEUE_TIMEOUT", "5")),
+        )
+
+    def acquire(self, timeout=None):
+        """
+        Wait for a slot and return the time spent queued, or raise AdmissionRejected.
+        `timeout` can shorten the queue wait further (e.g. the request's deadline).
+        """
+        started_at = time.monotonic()
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._admit()
+                return 0.0
+            if len(self._waiters) >= self.max_queue:
+                raise self._reject("queue_full")
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+            ADMISSION_QUEUE_DEPTH.labels(self.name).inc()
+
+        wait = (
+            self.queue_timeout if timeout is None else min(self.queue_timeout, timeout)
+        )
+        granted = waiter.wait(max(0.0, wait))
+        with self._lock:
+            # The slot may have been handed over right as the wait timed out
+            if not granted and not waiter.is_set():
+                self._waiters.remove(waiter)
+                ADMISSION_QUEUE_DEPTH.labels(self.name).dec()
+                raise self._reject("queue_timeout")
+            self.admitted += 1
+
+        queued_for = time.monotonic() - started_at
+        ADMISSION_QUEUE_WAIT.labels(self.name).observe(queued_for)
+        return queued_for
+
+    def release(self, duration=None):
+        """
+        Free the caller's slot; `duration` (seconds the request ran) refines Retry-After hints
+        """
+        with self._lock:
+            if duration is not None:
+                if self._service_time is None:
+                    self._service_time = duration
+                else:
+                    self._service_time += 0.2 * (duration - self._service_time)
+            if self._waiters:
+                # Hand the slot over, the number of active requests is unchanged
+                self._waiters.popleft().set()
+                ADMISSION_QUEUE_DEPTH.labels(self.name).dec()
+            else:
+                self._active -= 1
+                ADMISSION_IN_FLIGHT.labels(self.name).dec()
+
+    def _admit(self):
+        self._active += 1
+        self.admitted += 1
+        ADMISSION_IN_FLIGHT.labels(self.name).inc()
+        ADMISSION_QUEUE_WAIT.labels(self.name).observe(0.0)
+
+    def _reject(self, reason):
+        self.rejected[reason] += 1
+        ADMISSION_REJECTIONS.labels(self.name, reason).inc()
+        return AdmissionRejected(self.name, reason, self._retry_after())
+
+    def _retry_after(self):
+        # Roughly how long until the queue ahead has drained, at least a second
+        service_time = self._service_time or 1.0
+        turns = (len(self._waiters) + 1) / self.max_concurrent
+        return max(1, math.ceil(service_time * turns))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": self._active,
+                "queue_depth": len(self._waiters),
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "admitted": self.admitted,
+                "rejected": dict(self.rejected),
+            }
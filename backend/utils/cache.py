@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU cache that remembers when each entry was stored
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.time())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_with_age(self, key):
+        """
+        Return (value, age_in_seconds), or (None, None) on a miss
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            value, stored_at = entry
+            return value, time.time() - stored_at
+
+    def get(self, key):
+        return self.get_with_age(key)[0]
+
+    def peek(self, key):
+        """
+        Return the value without refreshing its LRU position or counting a hit/miss
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            return entry[0] if entry else None
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[0] if entry else None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+class TaggedTTLCache:
+    """
+    Thread-safe, size-bounded LRU cache for fresh reads
+    - freshness is decided per lookup (`get(key, ttl)`), so one cache can hold
+      endpoints with different TTLs
+    - entries carry tags, and `invalidate(tag)` drops every entry with that tag
+    - `set(..., generation=...)` refuses values fetched before an invalidation
+      of one of their tags, so a slow read can't resurrect invalidated data
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data = OrderedDict()  # key -> (value, stored_at, tags)
+        self._keys_by_tag = {}
+        self._generations = {}  # tag -> number of invalidations so far
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def get(self, key, ttl):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or time.monotonic() - entry[1] >= ttl:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def generation(self, tags):
+        """
+        Snapshot to pass to `set` for a value about to be fetched
+        """
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def set(self, key, value, tags=(), generation=None):
+        tags = tuple(tags)
+        with self._lock:
+            if generation is not None and generation != tuple(
+                self._generations.get(tag, 0) for tag in tags
+            ):
+                return False
+            self._remove(key)
+            self._data[key] = (value, time.monotonic(), tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._remove(next(iter(self._data)))
+            return True
+
+    def invalidate(self, tag):
+        """
+        Drop all entries tagged `tag` and return how many were dropped
+        """
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            keys = self._keys_by_tag.pop(tag, set())
+            for key in keys:
+                self._remove(key)
+            self.invalidated += len(keys)
+            return len(keys)
+
+    def _remove(self, key):
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._keys_by_tag.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidated": self.invalidated,
+            }
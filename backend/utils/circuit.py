@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is rejected because the upstream's circuit is open
+    """
+
+    def __init__(self, name, retry_in):
+        super().__init__(
+            f"Circuit for '{name}' is open, upstream marked unhealthy (retry in {retry_in:.1f}s)"
+        )
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Three-state circuit breaker for one upstream dependency
+    - closed: calls pass; `failure_threshold` consecutive failures open the circuit
+    - open: calls are rejected immediately for `reset_timeout` seconds
+    - half_open: up to `half_open_max_calls` probes pass; a success closes the
+      circuit, a failure re-opens it
+    """
+
+    def __init__(
+        self, name, failure_threshold=5, reset_timeout=30.0, half_open_max_calls=1
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self.rejected = 0  # calls short-circuited while open
+
+    @classmethod
+    def from_env(cls, name, prefix):
+        return cls(
+            name,
+            failure_threshold=int(os.getenv(f"{prefix}FAILURE_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv(f"{prefix}RESET_TIMEOUT", "30")),
+        )
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def before_call(self):
+        """
+        Reserve a call slot, raising CircuitOpenError if the call must not proceed
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+            raise CircuitOpenError(self.name, retry_in)
+
+    def release(self):
+        """
+        Give back a slot reserved by `before_call` without recording an outcome,
+        for a call that ended before it reached the upstream
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._half_open_calls = 0
+
+    def record_failure(self):
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._half_open_calls = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "rejected": self.rejected,
+            }
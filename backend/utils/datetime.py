@@ -1,8 +1,33 @@
-from datetime import datetime, timezone
-from dateutil import parser
-import pytz
+from datetime import date, datetime, timezone
+from functools import lru_cache
 import tzlocal
 
+# dateutil and pytz are only needed for non-ISO input and naive datetimes with
+# a user timezone, so they are imported on first use to keep startup fast
+
+
+def parse_datetime(datetime_string):
+    """
+    Parse a datetime string, trying the fast ISO-8601 parser first and falling
+    back to the general-purpose dateutil parser for anything else
+    """
+    try:
+        return datetime.fromisoformat(datetime_string)
+    except (TypeError, ValueError):
+        from dateutil import parser
+
+        return parser.parse(datetime_string)
+
+
+@lru_cache(maxsize=256)
+def get_timezone(timezone_name):
+    """
+    Cached pytz timezone lookup
+    """
+    import pytz
+
+    return pytz.timezone(timezone_name)
+
 
 def get_current_server_time_in_iso():
     return datetime.now().isoformat()
@@ -19,7 +44,7 @@ def get_day_range_utc(datetime_string):
     """
     try:
         # Parse the input datetime string (handles timezone automatically)
-        dt = parser.parse(datetime_string)
+        dt = parse_datetime(datetime_string)
 
         # Convert to UTC if it has timezone info
         if dt.tzinfo is not None:
@@ -47,13 +72,33 @@ def get_day_range_utc(datetime_string):
         raise ValueError(f"Error parsing datetime string '{datetime_string}': {str(e)}")
 
 
+def get_utc_dates(start, end=None):
+    """
+    UTC calendar dates ("YYYY-MM-DD") touched by the range from `start` to `end`
+    (inclusive), e.g. the days whose availability a booking affects
+    """
+    first = _to_utc(parse_datetime(start)).date()
+    last = _to_utc(parse_datetime(end)).date() if end else first
+    return [
+        date.fromordinal(ordinal).isoformat()
+        for ordinal in range(first.toordinal(), max(first, last).toordinal() + 1)
+    ]
+
+
+def _to_utc(dt):
+    # Naive datetimes are taken to be UTC already
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
 def convert_to_utc_format(datetime_string, user_timezone=None):
     """
     Convert any ISO datetime string to UTC format
     """
     try:
         # Parse the input datetime string (handles timezone automatically)
-        dt = parser.parse(datetime_string)
+        dt = parse_datetime(datetime_string)
 
         # Convert to UTC if it has timezone info
         if dt.tzinfo is not None:
@@ -62,7 +107,7 @@ def convert_to_utc_format(datetime_string, user_timezone=None):
             # If no timezone info, use the provided user_timezone or assume UTC
             if user_timezone:
                 # Apply the user's timezone to the naive datetime
-                user_tz = pytz.timezone(user_timezone)
+                user_tz = get_timezone(user_timezone)
                 dt_with_tz = user_tz.localize(dt)
                 dt_utc = dt_with_tz.astimezone(timezone.utc)
             else:
@@ -75,3 +120,23 @@ def convert_to_utc_format(datetime_string, user_timezone=None):
     except Exception as e:
         # @TODO: return error status and message
         raise ValueError(f"Error parsing datetime string '{datetime_string}': {str(e)}")
+
+
+def convert_many_to_utc_format(datetime_strings, user_timezone=None):
+    """
+    Batch version of `convert_to_utc_format`, e.g. for the start times of a list
+    of bookings. Repeated strings are converted once; entries that cannot be
+    parsed are returned as None instead of raising.
+    """
+    converted = {}
+    results = []
+    for datetime_string in datetime_strings:
+        if datetime_string not in converted:
+            try:
+                converted[datetime_string] = convert_to_utc_format(
+                    datetime_string, user_timezone
+                )
+            except ValueError:
+                converted[datetime_string] = None
+        results.append(converted[datetime_string])
+    return results
@@ -0,0 +1,56 @@
+import time
+from contextvars import ContextVar
+
+# time.monotonic() by which the current request must be answered, None if unbounded
+_deadline_at = ContextVar("deadline_at", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when there is no time left to call an upstream for the current request
+    """
+
+
+def set_deadline(timeout):
+    """
+    Bound the current context (request) to `timeout` seconds from now;
+    a deadline already in place is only ever tightened
+    """
+    deadline_at = time.monotonic() + timeout
+    current = _deadline_at.get()
+    if current is not None:
+        deadline_at = min(deadline_at, current)
+    _deadline_at.set(deadline_at)
+    return deadline_at
+
+
+def clear_deadline():
+    _deadline_at.set(None)
+
+
+def get_deadline():
+    return _deadline_at.get()
+
+
+def remaining(default=None):
+    """
+    Seconds left before the current deadline (never negative), or `default` without one
+    """
+    deadline_at = _deadline_at.get()
+    if deadline_at is None:
+        return default
+    return max(0.0, deadline_at - time.monotonic())
+
+
+def parse_timeout_header(value, default, maximum):
+    """
+    Request budget from a header holding seconds (e.g. `X-Request-Timeout: 20`),
+    capped at `maximum`; `default` when missing or invalid
+    """
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError):
+        return default
+    if timeout <= 0:
+        return default
+    return min(timeout, maximum)
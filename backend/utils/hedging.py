@@ -0,0 +1,113 @@
+import os
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """
+    Rolling window of recent latencies (in seconds) used to derive percentiles
+    """
+
+    def __init__(self, window=200):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._samples)
+
+
+class HedgingPolicy:
+    """
+    Decide when to send a duplicate (hedged) read request
+    - the hedge delay is the `percentile` of recent latencies for the endpoint,
+      never lower than `min_delay`; no hedging until `min_samples` are collected
+    - a token bucket keeps hedges under `budget` (fraction of extra requests):
+      every request earns `budget` tokens, each hedge spends one
+    """
+
+    def __init__(
+        self,
+        percentile=95.0,
+        min_delay=0.05,
+        min_samples=20,
+        budget=0.05,
+        max_tokens=10.0,
+        window=200,
+    ):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.window = window
+
+        self._lock = threading.Lock()
+        self._trackers = {}
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0  # hedged requests that answered first
+        self.budget_denied = 0
+
+    @classmethod
+    def from_env(cls, prefix="CALCOM_HEDGE_"):
+        return cls(
+            percentile=float(os.getenv(f"{prefix}PERCENTILE", "95")),
+            min_delay=float(os.getenv(f"{prefix}MIN_DELAY", "0.05")),
+            min_samples=int(os.getenv(f"{prefix}MIN_SAMPLES", "20")),
+            budget=float(os.getenv(f"{prefix}BUDGET", "0.05")),
+        )
+
+    def tracker(self, endpoint):
+        with self._lock:
+            if endpoint not in self._trackers:
+                self._trackers[endpoint] = LatencyTracker(self.window)
+            return self._trackers[endpoint]
+
+    def hedge_delay(self, endpoint):
+        """
+        Seconds to wait before hedging a request to `endpoint`, None to not hedge
+        Also counts the request towards the hedging budget.
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+        tracker = self.tracker(endpoint)
+        if len(tracker) < self.min_samples:
+            return None
+        return max(self.min_delay, tracker.percentile(self.percentile))
+
+    def try_acquire(self):
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self.hedges += 1
+                return True
+            self.budget_denied += 1
+            return False
+
+    def record_win(self):
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "budget_denied": self.budget_denied,
+            }
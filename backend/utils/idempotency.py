@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+
+from utils.metrics import IDEMPOTENCY_OUTCOMES
+
+
+class IdempotencyConflict(Exception):
+    """
+    Raised when a key is reused for a different request
+    """
+
+
+class IdempotencyInProgress(Exception):
+    """
+    Raised when a duplicate gave up waiting for the original request to finish
+    """
+
+
+class _Entry:
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.stored_at = None  # set once the result is kept for replay
+
+
+class IdempotencyStore:
+    """
+    Run each operation at most once per idempotency key
+    - the first call with a key executes; its result is kept for `ttl` seconds
+      (at most `maxsize` results, least recently used evicted first) and
+      replayed to later calls with the same key
+    - a duplicate arriving while the first call is in flight waits for it and
+      receives the same result (or exception) instead of executing again
+    - `should_store(result)` can keep transient failures out of the store, so a
+      later retry executes again
+    Results are shared between callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, name, maxsize=1024, ttl=3600.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> _Entry (in flight or completed)
+        self.outcomes = {"executed": 0, "replayed": 0, "waited": 0, "conflict": 0}
+
+    def run(self, key, fn, fingerprint=None, should_store=None, wait_timeout=None):
+        """
+        Return (result, replayed). `fingerprint` identifies the request behind
+        the key: reusing a key with another fingerprint raises IdempotencyConflict.
+        """
+        with self._lock:
+            self._evict_expired()
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint != fingerprint:
+                self._count("conflict")
+                raise IdempotencyConflict(
+                    f"Idempotency key '{key}' was already used for a different request"
+                )
+            if entry is None:
+                entry = _Entry(fingerprint)
+                self._entries[key] = entry
+                is_leader = True
+                self._count("executed")
+            else:
+                self._entries.move_to_end(key)
+                is_leader = False
+                self._count("replayed" if entry.done.is_set() else "waited")
+
+        if not is_leader:
+            if not entry.done.wait(wait_timeout):
+                raise IdempotencyInProgress(
+                    f"Request with idempotency key '{key}' is still in progress"
+                )
+            if entry.error is not None:
+                raise entry.error
+            return entry.result, True
+
+        try:
+            entry.result = fn()
+        except BaseException as e:
+            entry.error = e
+            self._drop(key, entry)
+            raise
+        finally:
+            entry.done.set()
+
+        if should_store is None or should_store(entry.result):
+            with self._lock:
+                entry.stored_at = time.monotonic()
+                while len(self._entries) > self.maxsize:
+                    oldest_key, oldest = next(iter(self._entries.items()))
+                    if oldest.stored_at is None:
+                        break  # never evict in-flight entries
+                    del self._entries[oldest_key]
+        else:
+            self._drop(key, entry)
+        return entry.result, False
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate):
+        """
+        Forget completed results for which `predicate(result)` is true
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if entry.stored_at is not None and predicate(entry.result)
+            ]:
+                del self._entries[key]
+
+    def _drop(self, key, entry):
+        # Duplicates already waiting still receive this result, later ones execute again
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for key in [
+            key
+            for key, entry in self._entries.items()
+            if entry.stored_at is not None and now - entry.stored_at >= self.ttl
+        ]:
+            del self._entries[key]
+
+    def _count(self, outcome):
+        # Called with the lock held
+        self.outcomes[outcome] += 1
+        IDEMPOTENCY_OUTCOMES.labels(self.name, outcome).inc()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._entries), **self.outcomes}
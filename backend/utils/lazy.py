@@ -0,0 +1,23 @@
+import threading
+
+
+class Lazy:
+    """
+    Value built by `factory` on first use and shared afterwards.
+    Keeps expensive clients (and the imports they pull in) off the module
+    import path; call `get()` ahead of time to build them eagerly.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._value = None
+        self.loaded = False
+
+    def get(self):
+        if not self.loaded:
+            with self._lock:
+                if not self.loaded:
+                    self._value = self._factory()
+                    self.loaded = True
+        return self._value
@@ -0,0 +1,73 @@
+import os
+import random
+import sys
+
+from loguru import logger
+
+# Minimum level emitted, e.g. DEBUG in development, INFO or WARNING in production
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
+# Hand records to a background thread so sinks never block the request
+LOG_ASYNC = os.getenv("LOG_ASYNC", "1") == "1"
+# Optional log file, rotated by size
+LOG_FILE = os.getenv("LOG_FILE")
+# Large payloads (API responses) are cut to this many characters
+LOG_PAYLOAD_MAX_CHARS = int(os.getenv("LOG_PAYLOAD_MAX_CHARS", "1000"))
+# Fraction of payload records that are kept
+LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "1.0"))
+
+
+class Truncated:
+    """
+    Lazily formatted, size-capped view of a payload. Nothing is converted to
+    text unless the record is actually emitted.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit=None):
+        self.value = value
+        self.limit = LOG_PAYLOAD_MAX_CHARS if limit is None else limit
+
+    def __str__(self):
+        text = str(self.value)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[:self.limit]}... [{len(text) - self.limit} more chars]"
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+def _sample_payloads(record):
+    if not record["extra"].get("payload"):
+        return True
+    return LOG_PAYLOAD_SAMPLE_RATE >= 1 or random.random() < LOG_PAYLOAD_SAMPLE_RATE
+
+
+# Logger for full request/response payloads: truncated and sampled.
+# Use brace-style arguments, e.g. payload_logger.debug("Slots: {}", Truncated(slots))
+payload_logger = logger.bind(payload=True)
+
+
+def configure_logging():
+    """
+    Replace loguru's default sink with the environment-configured ones
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=LOG_LEVEL,
+        filter=_sample_payloads,
+        enqueue=LOG_ASYNC,
+        backtrace=False,
+        diagnose=False,
+    )
+    if LOG_FILE:
+        logger.add(
+            LOG_FILE,
+            level=LOG_LEVEL,
+            filter=_sample_payloads,
+            enqueue=LOG_ASYNC,
+            rotation=os.getenv("LOG_FILE_ROTATION", "50 MB"),
+            retention=int(os.getenv("LOG_FILE_RETENTION", "5")),
+        )
@@ -0,0 +1,173 @@
+import functools
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+# Latency buckets (seconds) covering fast local work up to slow LLM turns
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+CHAT_REQUEST_LATENCY = Histogram(
+    "chat_request_duration_seconds",
+    "Latency of /api/chat requests",
+    buckets=LATENCY_BUCKETS,
+)
+LLM_COMPLETION_LATENCY = Histogram(
+    "llm_completion_duration_seconds",
+    "Latency of OpenAI chat completion calls",
+    ["model"],
+    buckets=LATENCY_BUCKETS,
+)
+TOOL_DISPATCH_LATENCY = Histogram(
+    "tool_dispatch_duration_seconds",
+    "Latency of function-call tools executed for the LLM",
+    ["tool"],
+    buckets=LATENCY_BUCKETS,
+)
+CALCOM_CALL_LATENCY = Histogram(
+    "calcom_call_duration_seconds",
+    "Latency of CalComTool Cal.com API wrappers",
+    ["method"],
+    buckets=LATENCY_BUCKETS,
+)
+FUNCTION_RETURN_CODES = Counter(
+    "function_return_total",
+    "Function call outcomes by FunctionReturnCode",
+    ["status", "code"],
+)
+CALCOM_RETRIES = Counter(
+    "calcom_retries_total",
+    "Cal.com request re-attempts issued by the retry policy",
+    ["endpoint"],
+)
+CACHE_HITS = Counter(
+    "cache_hits_total",
+    "Responses served from an in-process cache",
+    ["cache"],
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "Tokens used by OpenAI chat completions",
+    ["model", "kind"],
+)
+MODEL_ROUTING_DECISIONS = Counter(
+    "model_routing_decisions_total",
+    "Chat turns per selected model and routing rule",
+    ["model", "reason"],
+)
+MODEL_FALLBACKS = Counter(
+    "model_fallbacks_total",
+    "Turns retried on the large model after a malformed small-model reply",
+    ["from_model", "to_model"],
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight",
+    "Requests currently admitted by an admission controller",
+    ["name"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "admission_queue_depth",
+    "Requests waiting in an admission controller's queue",
+    ["name"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    "admission_queue_wait_seconds",
+    "Time admitted requests spent queued",
+    ["name"],
+    buckets=LATENCY_BUCKETS,
+)
+ADMISSION_REJECTIONS = Counter(
+    "admission_rejections_total",
+    "Requests rejected by an admission controller",
+    ["name", "reason"],
+)
+RATE_LIMITER_OUTCOMES = Counter(
+    "rate_limiter_outcomes_total",
+    "Rate limiter token requests by outcome (immediate, waited, rejected)",
+    ["limiter", "outcome"],
+)
+CALCOM_REFRESH_REQUESTS = Counter(
+    "calcom_refresh_requests_total",
+    "Background cache refresh requests by kind and outcome (refreshed, failed, skipped)",
+    ["kind", "outcome"],
+)
+IDEMPOTENCY_OUTCOMES = Counter(
+    "idempotency_outcomes_total",
+    "Idempotent operations by outcome (executed, replayed, waited, conflict)",
+    ["store", "outcome"],
+)
+CALCOM_WEBHOOK_EVENTS = Counter(
+    "calcom_webhook_events_total",
+    "Cal.com webhook deliveries by trigger and outcome (applied, ignored, rejected)",
+    ["trigger", "outcome"],
+)
+INTENT_ROUTER_DECISIONS = Counter(
+    "intent_router_decisions_total",
+    "Chat messages answered by the pre-LLM intent router (hit) or sent to the LLM (miss)",
+    ["outcome"],
+)
+INTENT_ROUTER_SECONDS_SAVED = Counter(
+    "intent_router_seconds_saved_total",
+    "Estimated LLM time saved by the intent router (mean completion latency per hit)",
+)
+
+
+def timed(histogram):
+    """
+    Decorator recording a call's latency in `histogram`, labelled by function name
+    """
+
+    def decorator(fn):
+        child = histogram.labels(fn.__name__)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - started_at)
+
+        return wrapper
+
+    return decorator
+
+
+def render_metrics():
+    """
+    Return (body, content_type) in Prometheus text format.
+    When PROMETHEUS_MULTIPROC_DIR is set (e.g. under gunicorn), metrics of all
+    worker processes are aggregated from that directory.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -2,7 +2,11 @@ import json
 
 
 def to_serializable(obj):
-    if hasattr(obj, "model_dump_json"):
+    if hasattr(obj, "model_dump"):
+        # Pydantic models (e.g. OpenAI responses): convert straight to
+        # JSON-compatible dicts, without a JSON string round trip
+        return obj.model_dump(mode="json")
+    elif hasattr(obj, "model_dump_json"):
         return json.loads(obj.model_dump_json())
     elif hasattr(obj, "__dict__"):
         return obj.__dict__
@@ -0,0 +1,170 @@
+import cProfile
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+# Fraction of requests profiled (0 disables sampling)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+# Allow clients to force profiling of a request with the `X-Profile: 1` header
+PROFILE_ALLOW_HEADER = os.getenv("PROFILE_ALLOW_HEADER", "0") == "1"
+PROFILE_DIR = os.getenv(
+    "PROFILE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "profiles"),
+)
+# Interval (seconds) of the wall-clock stack sampler
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+# Number of most expensive requests kept in the index
+PROFILE_INDEX_SIZE = int(os.getenv("PROFILE_INDEX_SIZE", "50"))
+
+_index_lock = threading.Lock()
+
+# tracemalloc is process-wide, so it runs while at least one profile is active
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+
+
+def should_profile(headers):
+    """
+    Decide whether the current request is profiled; costs one comparison when disabled
+    """
+    if PROFILE_ALLOW_HEADER and headers.get("X-Profile") == "1":
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def _acquire_tracemalloc():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0:
+            tracemalloc.stop()
+
+
+class _StackSampler(threading.Thread):
+    """
+    Samples the stack of one thread at a fixed interval (wall-clock profile)
+    """
+
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True, name="profile-sampler")
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class RequestProfiler:
+    """
+    Profile one request on the current thread
+    - CPU profile: cProfile timed with thread CPU time (.prof, pstats format)
+    - wall-clock profile: sampled stacks in collapsed/folded format (.folded),
+      usable with flamegraph.pl or speedscope
+    - allocations: top tracemalloc allocation sites (.alloc.txt)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.cpu_profile = cProfile.Profile(time.thread_time)
+        self.sampler = _StackSampler(threading.get_ident(), PROFILE_SAMPLE_INTERVAL)
+
+    def start(self):
+        _acquire_tracemalloc()
+        self.started_at = time.perf_counter()
+        self.cpu_started_at = time.thread_time()
+        self.sampler.start()
+        self.cpu_profile.enable()
+
+    def stop(self):
+        self.cpu_profile.disable()
+        self.sampler.stop()
+        self.wall_time = time.perf_counter() - self.started_at
+        self.cpu_time = time.thread_time() - self.cpu_started_at
+        self.allocations = tracemalloc.take_snapshot().statistics("lineno")[:30]
+        _release_tracemalloc()
+
+    def save(self, request_id, directory=None):
+        """
+        Write the profiles to `directory` and record the request in the index
+        """
+        directory = directory or PROFILE_DIR
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, request_id)
+
+        self.cpu_profile.dump_stats(f"{base}.prof")
+        with open(f"{base}.folded", "w", encoding="utf-8") as f:
+            for stack, count in self.sampler.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(f"{base}.alloc.txt", "w", encoding="utf-8") as f:
+            for stat in self.allocations:
+                f.write(f"{stat}\n")
+
+        _update_index(
+            directory,
+            {
+                "request_id": request_id,
+                "name": self.name,
+                "timestamp": time.time(),
+                "wall_ms": round(self.wall_time * 1000, 2),
+                "cpu_ms": round(self.cpu_time * 1000, 2),
+                "files": [
+                    f"{request_id}.prof",
+                    f"{request_id}.folded",
+                    f"{request_id}.alloc.txt",
+                ],
+            },
+        )
+
+
+def _update_index(directory, entry):
+    """
+    Keep index.json sorted by wall time, limited to the most expensive requests
+    """
+    path = os.path.join(directory, "index.json")
+    with _index_lock:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            index = []
+        index.append(entry)
+        index.sort(key=lambda e: e["wall_ms"], reverse=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(index[:PROFILE_INDEX_SIZE], f, indent=2)
+
+        # Drop the profiles of requests that fell out of the index
+        for evicted in index[PROFILE_INDEX_SIZE:]:
+            for name in evicted["files"]:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+
+from utils.metrics import RATE_LIMITER_OUTCOMES
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter shared by all threads calling one upstream
+    - tokens refill at `rate` per second up to `burst`; each request takes one
+    - `acquire` waits (up to a timeout) for a token, `try_acquire` never waits
+      and can leave a `reserve` untouched for callers that must not starve
+    A `rate` of 0 disables limiting.
+    """
+
+    def __init__(self, name, rate, burst):
+        self.name = name
+        self.rate = rate
+        self.burst = max(1.0, burst)
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self.outcomes = {"immediate": 0, "waited": 0, "rejected": 0}
+
+    @classmethod
+    def from_env(cls, name, prefix, per_minute=120.0, burst=20.0):
+        return cls(
+            name,
+            rate=float(os.getenv(f"{prefix}PER_MINUTE", str(per_minute))) / 60,
+            burst=float(os.getenv(f"{prefix}BURST", str(burst))),
+        )
+
+    @property
+    def enabled(self):
+        return self.rate > 0
+
+    def _refill(self):
+        # Called with the lock held
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def available(self):
+        """
+        Tokens left right now (`burst` when limiting is disabled)
+        """
+        if not self.enabled:
+            return self.burst
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, reserve=0.0):
+        """
+        Take a token if one is left beyond `reserve`, without waiting
+        """
+        if not self.enabled:
+            return True
+        with self._lock:
+            self._refill()
+            if self._tokens - 1 < reserve:
+                self._count("rejected")
+                return False
+            self._tokens -= 1
+            self._count("immediate")
+            return True
+
+    def acquire(self, timeout=None):
+        """
+        Take a token, waiting at most `timeout` seconds (forever if None) for one
+        """
+        if not self.enabled:
+            return True
+        give_up_at = None if timeout is None else time.monotonic() + timeout
+        waited = False
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._count("waited" if waited else "immediate")
+                    return True
+                wait = (1 - self._tokens) / self.rate
+                if give_up_at is not None:
+                    left = give_up_at - time.monotonic()
+                    if left < wait:
+                        self._count("rejected")
+                        return False
+            waited = True
+            time.sleep(wait)
+
+    def _count(self, outcome):
+        # Called with the lock held
+        self.outcomes[outcome] += 1
+        RATE_LIMITER_OUTCOMES.labels(self.name, outcome).inc()
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "per_minute": round(self.rate * 60, 2),
+            "burst": self.burst,
+            "available": round(self.available(), 2),
+            **self.outcomes,
+        }
@@ -0,0 +1,126 @@
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+# HTTP status codes that are worth retrying
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds, None if invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # HTTP-dates are rare, so email.utils is only imported when one shows up
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, bounded by a per-call deadline
+    - delay for attempt n is uniform(0, min(max_delay, base_delay * 2**n))
+    - a server-provided Retry-After replaces the computed delay; if it is longer
+      than `max_delay` (or the time left) the call gives up instead of retrying
+      early into another rejection
+    - no sleep is ever scheduled past the call's deadline
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        base_delay=0.25,
+        max_delay=4.0,
+        deadline=15.0,
+        retryable_status_codes=RETRYABLE_STATUS_CODES,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retryable_status_codes = retryable_status_codes
+
+        self._lock = threading.Lock()
+        self.retries = 0  # number of re-attempts issued
+        self.gave_up = 0  # calls that ran out of attempts or deadline
+
+    @classmethod
+    def from_env(
+        cls,
+        prefix="CALCOM_RETRY_",
+        max_attempts=3,
+        base_delay=0.25,
+        max_delay=4.0,
+        deadline=15.0,
+    ):
+        """
+        Build a policy from <prefix>* environment variables, with the given defaults
+        """
+        return cls(
+            max_attempts=int(os.getenv(f"{prefix}MAX_ATTEMPTS", max_attempts)),
+            base_delay=float(os.getenv(f"{prefix}BASE_DELAY", base_delay)),
+            max_delay=float(os.getenv(f"{prefix}MAX_DELAY", max_delay)),
+            deadline=float(os.getenv(f"{prefix}DEADLINE", deadline)),
+        )
+
+    def backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
+
+    def next_delay(self, attempt, started_at, retry_after=None, deadline_at=None):
+        """
+        Delay before the next attempt, or None if the call should give up
+        `attempt` is the zero-based index of the attempt that just failed
+        `deadline_at` optionally caps the call further (a time.monotonic() value,
+        e.g. the deadline of the request being served)
+        """
+        if attempt + 1 >= self.max_attempts:
+            self._record(gave_up=True)
+            return None
+        if retry_after is not None and retry_after > self.max_delay:
+            # The server asked for a longer wait than we are willing to spend
+            self._record(gave_up=True)
+            return None
+        delay = self.backoff(attempt, retry_after)
+        give_up_at = started_at + self.deadline
+        if deadline_at is not None:
+            give_up_at = min(give_up_at, deadline_at)
+        if time.monotonic() + delay >= give_up_at:
+            self._record(gave_up=True)
+            return None
+        self._record(gave_up=False)
+        return delay
+
+    def remaining(self, started_at, deadline_at=None):
+        remaining = started_at + self.deadline - time.monotonic()
+        if deadline_at is not None:
+            remaining = min(remaining, deadline_at - time.monotonic())
+        return max(0.0, remaining)
+
+    def _record(self, gave_up):
+        with self._lock:
+            if gave_up:
+                self.gave_up += 1
+            else:
+                self.retries += 1
+
+    def stats(self):
+        with self._lock:
+            return {"retries": self.retries, "gave_up": self.gave_up}
@@ -0,0 +1,191 @@
+import functools
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Fraction of traces exported to TRACE_EXPORT_FILE (0 disables the export)
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+TRACE_EXPORT_FILE = os.getenv(
+    "TRACE_EXPORT_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "traces", "traces.json"),
+)
+
+_current_trace = ContextVar("current_trace", default=None)
+_current_span_id = ContextVar("current_span_id", default=None)
+_export_lock = threading.Lock()
+
+
+class Trace:
+    """
+    Spans recorded while handling one request
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.trace_id = uuid.uuid4().hex
+        self.started_at = time.perf_counter()
+        self.started_at_epoch_us = time.time() * 1e6
+        self.duration = None
+        self.spans = []  # (name, span_id, parent_id, start, end, thread_id)
+        self._lock = threading.Lock()
+
+    def add_span(self, name, span_id, parent_id, start, end):
+        with self._lock:
+            self.spans.append(
+                (name, span_id, parent_id, start, end, threading.get_ident())
+            )
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started_at
+
+    def server_timing_header(self):
+        """
+        Server-Timing header value: total time, then time per span name
+        (summed when a span name occurs more than once)
+        """
+        totals = {}
+        with self._lock:
+            for name, _, _, start, end, _ in self.spans:
+                duration, count = totals.get(name, (0.0, 0))
+                totals[name] = (duration + end - start, count + 1)
+
+        entries = [f"total;dur={self.duration * 1000:.1f}"]
+        for name, (duration, count) in totals.items():
+            entry = f"{name};dur={duration * 1000:.1f}"
+            if count > 1:
+                entry += f';desc="x{count}"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+    def to_trace_events(self):
+        """
+        Spans as Chrome Trace Event Format complete ("X") events,
+        viewable in Perfetto or chrome://tracing
+        """
+        pid = os.getpid()
+
+        def event(name, start, end, tid, args):
+            return {
+                "name": name,
+                "cat": "calcom-agent",
+                "ph": "X",
+                "ts": round(self.started_at_epoch_us + (start - self.started_at) * 1e6),
+                "dur": round((end - start) * 1e6),
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+
+        events = [
+            event(
+                self.name,
+                self.started_at,
+                self.started_at + self.duration,
+                threading.get_ident(),
+                {"trace_id": self.trace_id},
+            )
+        ]
+        with self._lock:
+            for name, span_id, parent_id, start, end, tid in self.spans:
+                events.append(
+                    event(
+                        name,
+                        start,
+                        end,
+                        tid,
+                        {
+                            "trace_id": self.trace_id,
+                            "span_id": span_id,
+                            "parent_id": parent_id,
+                        },
+                    )
+                )
+        return events
+
+
+def start_trace(name):
+    trace = Trace(name)
+    _current_trace.set(trace)
+    _current_span_id.set(None)
+    return trace
+
+
+def current_trace():
+    return _current_trace.get()
+
+
+def finish_trace():
+    """
+    Close the current trace, export it if sampled, and return it (None if no trace)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return None
+    trace.finish()
+    _current_trace.set(None)
+    _current_span_id.set(None)
+    if TRACE_SAMPLE_RATE > 0 and random.random() < TRACE_SAMPLE_RATE:
+        export_trace(trace)
+    return trace
+
+
+@contextmanager
+def span(name):
+    """
+    Time a block as a span of the current trace; a no-op when no trace is active
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    span_id = uuid.uuid4().hex[:16]
+    parent_id = _current_span_id.get()
+    token = _current_span_id.set(span_id)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, span_id, parent_id, start, time.perf_counter())
+        _current_span_id.reset(token)
+
+
+def traced(prefix=""):
+    """
+    Decorator recording each call as a span named `prefix` + function name
+    """
+
+    def decorator(fn):
+        name = f"{prefix}{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def export_trace(trace, path=None):
+    """
+    Append a trace to a Chrome Trace Event Format file (JSON array format,
+    where the closing bracket is optional so events can be appended)
+    """
+    path = path or TRACE_EXPORT_FILE
+    with _export_lock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, "a", encoding="utf-8") as f:
+            if is_new:
+                f.write("[\n")
+            for event in trace.to_trace_events():
+                f.write(json.dumps(event) + ",\n")
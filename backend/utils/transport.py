@@ -0,0 +1,155 @@
+import gzip
+import json
+import os
+import threading
+import time
+
+import requests
+from loguru import logger
+
+
+def _open_cassette(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _request_key(method, url, headers=None, params=None, json_body=None):
+    """
+    Identify a request independently of credentials and dict ordering
+    """
+    return json.dumps(
+        [
+            method.upper(),
+            url,
+            (headers or {}).get("cal-api-version"),
+            sorted((str(k), str(v)) for k, v in (params or {}).items()),
+            json_body,
+        ],
+        sort_keys=True,
+    )
+
+
+def _json_dumps(value):
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _build_response(entry, url):
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.url = url
+    response.reason = entry.get("reason", "")
+    response.headers.update(entry.get("headers", {}))
+    response.encoding = "utf-8"
+    if "json" in entry:
+        response._content = json.dumps(entry["json"]).encode("utf-8")
+    else:
+        response._content = entry.get("text", "").encode("utf-8")
+    return response
+
+
+class RecordingTransport:
+    """
+    Send requests live and append each request/response pair to a cassette
+    (JSON lines, gzip-compressed when the path ends with .gz).
+    Request headers are not stored, so credentials never reach the cassette.
+    """
+
+    def __init__(self, cassette_path, send=requests.request):
+        self.cassette_path = cassette_path
+        self.send = send
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(cassette_path)), exist_ok=True)
+
+    def __call__(self, method, url, headers=None, params=None, json=None, **kwargs):
+        started_at = time.perf_counter()
+        response = self.send(
+            method, url, headers=headers, params=params, json=json, **kwargs
+        )
+        entry = {
+            "key": _request_key(method, url, headers, params, json),
+            "latency": round(time.perf_counter() - started_at, 4),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: response.headers[name]
+                for name in ("Retry-After", "Content-Type")
+                if name in response.headers
+            },
+        }
+        try:
+            entry["json"] = response.json()
+        except ValueError:
+            entry["text"] = response.text
+
+        with self._lock, _open_cassette(self.cassette_path, "a") as f:
+            f.write(_json_dumps(entry) + "\n")
+        return response
+
+
+class ReplayTransport:
+    """
+    Serve responses from a cassette without touching the network.
+    Repeated identical requests are answered with the recorded responses in
+    order; once exhausted, the last one is repeated. With `simulate_latency`,
+    each response is delayed by its recorded upstream latency.
+    """
+
+    def __init__(self, cassette_path, simulate_latency=False):
+        self.cassette_path = cassette_path
+        self.simulate_latency = simulate_latency
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> list of recorded entries
+        self._cursors = {}  # key -> index of the next entry to serve
+        self.misses = 0
+
+        with _open_cassette(cassette_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry["key"], []).append(entry)
+
+    def __call__(self, method, url, headers=None, params=None, json=None, **kwargs):
+        key = _request_key(method, url, headers, params, json)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                entry = None
+            else:
+                index = self._cursors.get(key, 0)
+                entry = entries[min(index, len(entries) - 1)]
+                self._cursors[key] = index + 1
+
+        if entry is None:
+            logger.warning("No recorded response for {} {}", method, url)
+            raise requests.exceptions.ConnectionError(
+                f"No recorded response in cassette for {method} {url}"
+            )
+
+        if self.simulate_latency:
+            time.sleep(entry["latency"])
+        return _build_response(entry, url)
+
+
+def transport_from_env(prefix="CALCOM_", session=None):
+    """
+    Build the transport selected by <prefix>TRANSPORT: live (default), record or replay.
+    Live requests are sent through `session` (a requests.Session) when given.
+    """
+    send = session.request if session is not None else requests.request
+    mode = os.getenv(f"{prefix}TRANSPORT", "live")
+    cassette = os.getenv(f"{prefix}CASSETTE", "cassettes/calcom.jsonl.gz")
+
+    if mode == "record":
+        logger.info("Recording Cal.com traffic to {}", cassette)
+        return RecordingTransport(cassette, send=send)
+    if mode == "replay":
+        logger.info("Replaying Cal.com traffic from {}", cassette)
+        return ReplayTransport(
+            cassette,
+            simulate_latency=os.getenv(f"{prefix}REPLAY_LATENCY", "0") == "1",
+        )
+    if mode != "live":
+        raise ValueError(f"Unknown {prefix}TRANSPORT '{mode}'")
+    return send
@@ -0,0 +1,20 @@
+import hashlib
+import hmac
+
+
+def sign_payload(secret, body):
+    """
+    Hex HMAC-SHA256 of a raw request body, as sent by Cal.com in `X-Cal-Signature-256`
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret, body, signature):
+    """
+    Whether `signature` is the HMAC-SHA256 of `body` under `secret` (constant time)
+    """
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign_payload(secret, body), signature.strip().lower())